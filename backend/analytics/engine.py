@@ -0,0 +1,149 @@
+from datetime import timedelta
+from itertools import islice
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Count
+from attendance.models import Attendance
+from departments.models import Department
+
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+CHUNK_SIZE = 10000
+
+
+def load_daily_counts(start, end, chunk_size=CHUNK_SIZE):
+    """
+    Present and absent counts per (department, day) between start and end,
+    as two departments x days matrices. Rows are grouped in the database and
+    streamed in chunks into NumPy arrays, so memory is bounded by the number
+    of departments and days, not by the number of attendance rows.
+    """
+    departments = list(Department.objects.order_by('name').values_list('id', 'key', 'name'))
+    row_of = {pk: index for index, (pk, _, _) in enumerate(departments)}
+    days = (end - start).days + 1
+    present = np.zeros((len(departments), days), dtype=np.int64)
+    absent = np.zeros((len(departments), days), dtype=np.int64)
+
+    groups = (
+        Attendance.objects
+        .filter(date__range=(start, end))
+        .order_by()
+        .values_list('employee__department_id', 'date', 'status')
+        .annotate(count=Count('id'))
+        .iterator(chunk_size=chunk_size)
+    )
+    while chunk := list(islice(groups, chunk_size)):
+        department_id, day, record_status, count = zip(*chunk)
+        rows = np.fromiter((row_of[pk] for pk in department_id), dtype=np.intp, count=len(chunk))
+        columns = np.fromiter(((value - start).days for value in day), dtype=np.intp, count=len(chunk))
+        counts = np.array(count, dtype=np.int64)
+        is_present = np.array(record_status) == 'Present'
+        np.add.at(present, (rows[is_present], columns[is_present]), counts[is_present])
+        np.add.at(absent, (rows[~is_present], columns[~is_present]), counts[~is_present])
+
+    return [(key, name) for _, key, name in departments], present, absent
+
+
+def rolling_sum(matrix, window):
+    """Sum over the trailing `window` days for every day from the window-th on."""
+    totals = np.cumsum(matrix, axis=-1)
+    totals = np.concatenate([np.zeros(matrix.shape[:-1] + (1,), dtype=totals.dtype), totals], axis=-1)
+    return totals[..., window:] - totals[..., :-window]
+
+
+def absence_rate(absent, present):
+    marked = absent + present
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(marked > 0, absent / marked * 100, np.nan)
+
+
+def z_scores(rates):
+    """
+    Standard score of each department's rate against the other departments
+    that day (leave-one-out). Including a department in its own baseline
+    caps its score at sqrt(n - 1), so with few departments an outlier could
+    never reach the threshold. NaN where the department has no rate; 0 where
+    fewer than two others do or they all share one rate.
+    """
+    present = ~np.isnan(rates)
+    values = np.where(present, rates, 0.0)
+    others = present.sum(axis=0) - present
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = (values.sum(axis=0) - values) / others
+        variance = ((values ** 2).sum(axis=0) - values ** 2) / others - mean ** 2
+        # Clamp rounding noise so identical rates give exactly zero.
+        std = np.sqrt(np.maximum(variance, 0.0))
+        scores = np.where((others >= 2) & (std > 1e-9), (rates - mean) / std, 0.0)
+    return np.where(present, scores, np.nan)
+
+
+def _number(value, digits):
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def _day_of_week(first_day, absent, present):
+    weekday = (first_day.weekday() + np.arange(absent.shape[-1])) % 7
+    absent_by_day = np.bincount(weekday, weights=absent, minlength=7)
+    present_by_day = np.bincount(weekday, weights=present, minlength=7)
+    rates = absence_rate(absent_by_day, present_by_day)
+    return [
+        {'day': WEEKDAYS[day], 'records': int(absent_by_day[day] + present_by_day[day]),
+         'absence_rate': _number(rates[day], 2)}
+        for day in range(7)
+    ]
+
+
+def compute(window, end, history_days=None):
+    """
+    Absenteeism analytics for every scope ('all' and each department key)
+    over the `history_days` days ending at `end`: the rolling `window`-day
+    absence rate, day-of-week rates, and days on which a department's
+    rolling rate is unusually high among departments (z-score at or above
+    ANALYTICS_Z_THRESHOLD). Returns {scope: result}.
+    """
+    history_days = history_days or settings.ANALYTICS_HISTORY_DAYS
+    threshold = settings.ANALYTICS_Z_THRESHOLD
+    # Load window - 1 extra days so the first reported day has a full window.
+    start = end - timedelta(days=history_days + window - 2)
+    first_day = end - timedelta(days=history_days - 1)
+    departments, present, absent = load_daily_counts(start, end)
+
+    rates = absence_rate(rolling_sum(absent, window), rolling_sum(present, window))
+    scores = z_scores(rates) if len(departments) else rates
+    company_rates = absence_rate(rolling_sum(absent.sum(axis=0), window), rolling_sum(present.sum(axis=0), window))
+    dates = [(first_day + timedelta(days=offset)).isoformat() for offset in range(history_days)]
+    tail = slice(window - 1, None)
+
+    summary = [
+        {'department': name, 'absence_rate': _number(rates[row, -1], 2),
+         'z_score': _number(scores[row, -1], 2), 'outlier': bool(scores[row, -1] >= threshold)}
+        for row, (_, name) in enumerate(departments)
+    ]
+    outliers = np.argwhere(scores >= threshold)
+
+    def result(scope, series, absent_days, present_days, anomalies):
+        return {
+            'scope': scope,
+            'window': window,
+            'start': dates[0],
+            'end': dates[-1],
+            'rolling': [{'date': day, 'absence_rate': _number(rate, 2)} for day, rate in zip(dates, series)],
+            'day_of_week': _day_of_week(first_day, absent_days, present_days),
+            'departments': summary,
+            'anomalies': anomalies,
+        }
+
+    results = {'all': result(
+        'all', company_rates, absent.sum(axis=0)[tail], present.sum(axis=0)[tail],
+        [{'department': departments[row][1], 'date': dates[column],
+          'absence_rate': _number(rates[row, column], 2), 'z_score': _number(scores[row, column], 2)}
+         for row, column in outliers],
+    )}
+    for row, (key, name) in enumerate(departments):
+        results[key] = result(
+            name, rates[row], absent[row, tail], present[row, tail],
+            [{'date': dates[column], 'absence_rate': _number(rates[row, column], 2),
+              'z_score': _number(scores[row, column], 2)}
+             for column in outliers[outliers[:, 0] == row, 1]],
+        )
+    return results
@@ -0,0 +1,63 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from departments.models import Department, normalize_department
+from hrms.throttling import single_flight
+from .engine import compute
+
+
+class AnalyticsFilterSerializer(serializers.Serializer):
+    department = serializers.CharField(required=False, allow_blank=True)
+    window = serializers.IntegerField(min_value=1, max_value=365, default=30)
+
+
+def cache_key(end, window, scope):
+    # Department keys hold spaces and any characters; hash them so keys stay
+    # valid for memcached (and free of CacheKeyWarning).
+    digest = hashlib.sha1(scope.encode()).hexdigest()
+    return f'analytics:{end.isoformat()}:{window}:{digest}'
+
+
+def get_analytics(window, scope, end):
+    """
+    Cached result for (scope, window). A miss computes every scope for the
+    window in one pass, since outliers are relative to all departments.
+    """
+    result = cache.get(cache_key(end, window, scope))
+    if result is None:
+        results = compute(window, end)
+        cache.set_many(
+            {cache_key(end, window, name): value for name, value in results.items()},
+            settings.ANALYTICS_CACHE_SECONDS,
+        )
+        result = results.get(scope)
+    return result
+
+
+@api_view(['GET'])
+@single_flight
+def absenteeism(request):
+    filters = AnalyticsFilterSerializer(data=request.query_params)
+    if not filters.is_valid():
+        return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+    window = filters.validated_data['window']
+
+    scope = 'all'
+    if filters.validated_data.get('department'):
+        scope = normalize_department(filters.validated_data['department'])
+        if not Department.objects.filter(key=scope).exists():
+            return Response(
+                {'error': 'Department not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+    result = get_analytics(window, scope, timezone.localdate())
+    if result is None:
+        # Created after the cached pass for this window; not in it yet.
+        result = compute(window, timezone.localdate())[scope]
+    return Response(result, status=status.HTTP_200_OK)
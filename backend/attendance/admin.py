@@ -1,9 +1,24 @@
 from django.contrib import admin
-from .models import Attendance
+from hrms.admin_tools import EmployeeSearchMixin, ScalableModelAdmin
+from .models import Attendance, AttendanceEvent
 
 @admin.register(Attendance)
-class AttendanceAdmin(admin.ModelAdmin):
-    list_display = ['employee', 'date', 'status', 'created_at']
-    search_fields = ['employee__full_name', 'employee__employee_id']
-    list_filter = ['status', 'date', 'created_at']
-    ordering = ['-date']
\ No newline at end of file
+class AttendanceAdmin(EmployeeSearchMixin, ScalableModelAdmin):
+    list_display = ['employee', 'date', 'status', 'worked_minutes', 'created_at']
+    # Employee id, email or name prefix; matched on the employees table first.
+    search_fields = ['employee__employee_id']
+    list_filter = ['status']
+    list_select_related = ['employee']
+    autocomplete_fields = ['employee']
+    date_hierarchy = 'date'
+    ordering = ['-date']
+
+@admin.register(AttendanceEvent)
+class AttendanceEventAdmin(EmployeeSearchMixin, ScalableModelAdmin):
+    list_display = ['employee', 'kind', 'occurred_at', 'source', 'received_at']
+    search_fields = ['employee__employee_id']
+    list_filter = ['kind']
+    list_select_related = ['employee']
+    autocomplete_fields = ['employee']
+    date_hierarchy = 'received_at'
+    ordering = ['-received_at']
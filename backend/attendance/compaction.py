@@ -0,0 +1,124 @@
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from itertools import groupby
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from .models import Attendance, AttendanceEvent, CompactionCheckpoint
+from .signals import send_batch_saved
+
+CHECKPOINT = 'attendance_events'
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _day_bounds(day):
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def fold_events(employee_id, day, events):
+    """
+    Pair each check-in made on `day` with the next check-out, which may fall
+    on the following day (overnight shifts), and sum the intervals.
+    Repeated check-ins keep the earliest; an unmatched check-in is ignored,
+    as is a check-out with no open check-in (it closed the previous day's
+    shift). `events` are (kind, occurred_at) in time order, starting at the
+    day's start. Returns None when there is no check-in on `day`.
+    """
+    _, end = _day_bounds(day)
+    first_in = last_out = opened = None
+    worked = timedelta()
+    for kind, occurred_at in events:
+        if kind == 'in':
+            if occurred_at >= end:
+                break
+            first_in = first_in or occurred_at
+            opened = opened or occurred_at
+        elif opened is not None:
+            last_out = occurred_at
+            worked += occurred_at - opened
+            opened = None
+        elif occurred_at >= end:
+            break
+    if first_in is None:
+        return None
+    return Attendance(
+        employee_id=employee_id,
+        date=day,
+        status='Present',
+        first_check_in=first_in,
+        last_check_out=last_out,
+        worked_minutes=int(worked.total_seconds() // 60),
+    )
+
+
+# A row marked by hand keeps its status; new rows are inserted as Present.
+UPSERT_FIELDS = ['first_check_in', 'last_check_out', 'worked_minutes', 'updated_at']
+
+
+def compact_days(pairs, chunk_size=500):
+    """
+    Rebuild the Attendance rows for the given (employee_id, date) pairs.
+    Events are read into the following day so overnight shifts close.
+    """
+    by_day = {}
+    for employee_id, day in pairs:
+        by_day.setdefault(day, []).append(employee_id)
+
+    instances = []
+    for day, employee_ids in sorted(by_day.items()):
+        start, end = _day_bounds(day)
+        for offset in range(0, len(employee_ids), chunk_size):
+            events = (
+                AttendanceEvent.objects
+                .filter(employee_id__in=employee_ids[offset:offset + chunk_size],
+                        occurred_at__gte=start, occurred_at__lt=end + timedelta(days=1))
+                .order_by('employee_id', 'occurred_at')
+                .values_list('employee_id', 'kind', 'occurred_at')
+            )
+            for employee_id, rows in groupby(events.iterator(), key=lambda row: row[0]):
+                instance = fold_events(employee_id, day, [(kind, at) for _, kind, at in rows])
+                if instance is not None:
+                    instances.append(instance)
+
+    if instances:
+        Attendance.objects.bulk_create(
+            instances,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['employee', 'date'],
+            update_fields=UPSERT_FIELDS,
+        )
+        send_batch_saved(instances, UPSERT_FIELDS)
+    return len(instances)
+
+
+def compact_events():
+    """
+    Fold events received since the last run into daily Attendance rows.
+    The window overlaps the previous run so events committed late are not
+    skipped; rebuilding a day is idempotent.
+    """
+    overlap = timedelta(seconds=getattr(settings, 'COMPACTION_OVERLAP_SECONDS', 60))
+    with transaction.atomic():
+        checkpoint, _ = (
+            CompactionCheckpoint.objects.select_for_update()
+            .get_or_create(name=CHECKPOINT, defaults={'position': EPOCH})
+        )
+        started = timezone.now()
+        touched = (
+            AttendanceEvent.objects
+            .filter(received_at__gte=checkpoint.position - overlap)
+            .annotate(day=TruncDate('occurred_at'))
+            .order_by()
+            .values_list('employee_id', 'day')
+            .distinct()
+        )
+        # A check-out may close a shift that started the day before.
+        pairs = {(employee_id, shifted) for employee_id, day in touched
+                 for shifted in (day, day - timedelta(days=1))}
+        compacted = compact_days(pairs)
+        checkpoint.position = started
+        checkpoint.save(update_fields=['position'])
+    return compacted
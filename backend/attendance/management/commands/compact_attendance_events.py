@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from attendance.compaction import compact_events
+
+
+class Command(BaseCommand):
+    help = 'Fold clock-in/clock-out events received since the last run into daily attendance rows.'
+
+    def handle(self, *args, **options):
+        compacted = compact_events()
+        self.stdout.write(self.style.SUCCESS(f'Compacted {compacted} attendance day(s).'))
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0001_initial"),
+        ("employees", "0002_employee_employees_updated_9a6c79_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["updated_at"], name="attendance_updated_12b935_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0002_attendance_attendance_updated_12b935_idx"),
+        ("employees", "0005_employee_department_fk"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompactionCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("position", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "compaction_checkpoints",
+            },
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="first_check_in",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="last_check_out",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="worked_minutes",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="AttendanceEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("in", "Check in"), ("out", "Check out")], max_length=3
+                    ),
+                ),
+                ("occurred_at", models.DateTimeField()),
+                ("source", models.CharField(blank=True, max_length=50)),
+                ("received_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "employee",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attendance_events",
+                        to="employees.employee",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "attendance_events",
+                "ordering": ["occurred_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["employee", "occurred_at"],
+                        name="attendance__employe_3b2b10_idx",
+                    ),
+                    models.Index(
+                        fields=["received_at"], name="attendance__receive_15c1cd_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
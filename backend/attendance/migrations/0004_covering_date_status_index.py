@@ -0,0 +1,24 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0003_compactioncheckpoint_attendance_first_check_in_and_more"),
+        ("employees", "0006_admin_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="attendance",
+            name="attendance_date_d460ba_idx",
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["date", "status", "employee"], name="attendance_date_status_idx"
+            ),
+        ),
+    ]
@@ -10,6 +10,10 @@ class Attendance(models.Model):
     employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='attendance_records')
     date = models.DateField(db_index=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    # Filled in by compacting clock events; null for manually marked days.
+    first_check_in = models.DateTimeField(null=True, blank=True)
+    last_check_out = models.DateTimeField(null=True, blank=True)
+    worked_minutes = models.PositiveIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -19,8 +23,48 @@ class Attendance(models.Model):
         unique_together = ['employee', 'date']
         indexes = [
             models.Index(fields=['employee', 'date']),
-            models.Index(fields=['date']),
+            # Covers per-day status counts (dashboard, analytics) without
+            # touching the table; still serves plain date lookups.
+            models.Index(fields=['date', 'status', 'employee'], name='attendance_date_status_idx'),
+            models.Index(fields=['updated_at']),
         ]
     
     def __str__(self):
-        return f"{self.employee.full_name} - {self.date} - {self.status}"
\ No newline at end of file
+        return f"{self.employee.full_name} - {self.date} - {self.status}"
+
+class AttendanceEvent(models.Model):
+    """
+    Append-only clock-in/clock-out events from badge readers. Rows are never
+    updated; compaction folds them into the daily Attendance row.
+    """
+    KIND_CHOICES = [
+        ('in', 'Check in'),
+        ('out', 'Check out'),
+    ]
+
+    employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='attendance_events')
+    kind = models.CharField(max_length=3, choices=KIND_CHOICES)
+    occurred_at = models.DateTimeField()
+    source = models.CharField(max_length=50, blank=True)
+    received_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'attendance_events'
+        ordering = ['occurred_at']
+        indexes = [
+            models.Index(fields=['employee', 'occurred_at']),
+            models.Index(fields=['received_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.employee_id} - {self.kind} - {self.occurred_at}"
+
+class CompactionCheckpoint(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+    position = models.DateTimeField()
+
+    class Meta:
+        db_table = 'compaction_checkpoints'
+
+    def __str__(self):
+        return f"{self.name} @ {self.position}"
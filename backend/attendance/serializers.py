@@ -1,16 +1,19 @@
+from django.conf import settings
 from rest_framework import serializers
-from .models import Attendance
+from .models import Attendance, AttendanceEvent
 from employees.models import Employee
 from datetime import datetime
+from hrms.sparse import SparseFieldsetMixin
 
-class AttendanceSerializer(serializers.ModelSerializer):
+class AttendanceSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     employee_name = serializers.CharField(source='employee.full_name', read_only=True)
     employee_id = serializers.CharField(source='employee.employee_id', read_only=True)
     
     class Meta:
         model = Attendance
-        fields = ['id', 'employee', 'employee_name', 'employee_id', 'date', 'status', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        fields = ['id', 'employee', 'employee_name', 'employee_id', 'date', 'status',
+                  'first_check_in', 'last_check_out', 'worked_minutes', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'first_check_in', 'last_check_out', 'worked_minutes', 'created_at', 'updated_at']
     
     def validate_employee(self, value):
         if not value:
@@ -35,4 +38,72 @@ class AttendanceSerializer(serializers.ModelSerializer):
             date = data.get('date')
             if Attendance.objects.filter(employee=employee, date=date).exists():
                 raise serializers.ValidationError("Attendance for this employee on this date already exists.")
-        return data
\ No newline at end of file
+        return data
+
+class AttendanceUpdateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Attendance
+        fields = ['status']
+
+    def validate_status(self, value):
+        if value not in ['Present', 'Absent']:
+            raise serializers.ValidationError("Status must be either 'Present' or 'Absent'.")
+        return value
+
+class UnmarkedFilterSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    department = serializers.CharField(required=False, allow_blank=True)
+
+class UnmarkedPageSerializer(UnmarkedFilterSerializer):
+    after = serializers.IntegerField(min_value=0, default=0)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+class BulkMarkSerializer(UnmarkedFilterSerializer):
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES)
+
+class AttendanceEventSerializer(serializers.Serializer):
+    employee = serializers.IntegerField()
+    kind = serializers.ChoiceField(choices=AttendanceEvent.KIND_CHOICES)
+    occurred_at = serializers.DateTimeField()
+    source = serializers.CharField(max_length=50, required=False, allow_blank=True, default='')
+
+class WorkedHoursFilterSerializer(serializers.Serializer):
+    GROUP_CHOICES = ['employee', 'department']
+
+    start = serializers.DateField()
+    end = serializers.DateField()
+    group = serializers.ChoiceField(choices=GROUP_CHOICES, default='employee')
+    department = serializers.CharField(required=False, allow_blank=True)
+
+    def validate(self, data):
+        if data['start'] > data['end']:
+            raise serializers.ValidationError("start must not be after end.")
+        return data
+
+class AttendanceBatchFilterSerializer(serializers.Serializer):
+    employee_ids = serializers.CharField()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # `from` is a Python keyword, so these cannot be class attributes.
+        fields['from'] = serializers.DateField(required=False)
+        fields['to'] = serializers.DateField(required=False)
+        return fields
+
+    def validate_employee_ids(self, value):
+        try:
+            ids = list(dict.fromkeys(int(part) for part in value.split(',') if part.strip()))
+        except ValueError:
+            raise serializers.ValidationError("employee_ids must be a comma-separated list of integers.")
+        if not ids:
+            raise serializers.ValidationError("At least one employee id is required.")
+        if len(ids) > settings.ATTENDANCE_BATCH_MAX_EMPLOYEES:
+            raise serializers.ValidationError(
+                f"At most {settings.ATTENDANCE_BATCH_MAX_EMPLOYEES} employee ids per request."
+            )
+        return ids
+
+    def validate(self, data):
+        if 'from' in data and 'to' in data and data['from'] > data['to']:
+            raise serializers.ValidationError("from must not be after to.")
+        return data
@@ -0,0 +1,49 @@
+from django.dispatch import Signal
+from .models import Attendance
+
+# Sent after a batch of attendance rows is upserted with bulk_create, which
+# bypasses post_save. Receivers get `instances`, the Attendance objects whose
+# rows this batch wrote (pks set), `created`, those of them it inserted, and
+# `update_fields`, the columns an upsert overwrote on the others.
+# Use send_batch_saved() rather than sending it directly.
+attendance_batch_saved = Signal()
+
+
+def written_rows(instances, chunk_size=500):
+    """
+    Re-read the rows a bulk_create of `instances` targeted, by (employee,
+    date), and return (written, created): the instances whose row holds the
+    updated_at that bulk_create stamped on them, with pks set, and those
+    whose created_at matches too. Rows left alone by ignore_conflicts keep
+    their own timestamps and are excluded.
+    """
+    by_day = {}
+    for instance in instances:
+        by_day.setdefault(instance.date, {})[instance.employee_id] = instance
+
+    written, created = [], []
+    for day, by_employee in sorted(by_day.items()):
+        employee_ids = list(by_employee)
+        for offset in range(0, len(employee_ids), chunk_size):
+            rows = Attendance.objects.filter(
+                date=day, employee_id__in=employee_ids[offset:offset + chunk_size]
+            ).values_list('employee_id', 'id', 'created_at', 'updated_at')
+            for employee_id, pk, created_at, updated_at in rows:
+                instance = by_employee[employee_id]
+                if updated_at != instance.updated_at:
+                    continue
+                instance.pk = pk
+                written.append(instance)
+                if created_at == instance.created_at:
+                    created.append(instance)
+    return written, created
+
+
+def send_batch_saved(instances, update_fields=()):
+    """Send attendance_batch_saved for the rows a bulk_create wrote; returns them."""
+    written, created = written_rows(instances)
+    if written:
+        attendance_batch_saved.send(
+            sender=Attendance, instances=written, created=created, update_fields=frozenset(update_fields),
+        )
+    return written, created
@@ -2,7 +2,12 @@ from django.urls import path
 from . import views
 
 urlpatterns = [
-    path('', views.attendance_create, name='attendance-create'),
+    path('', views.attendance_list_create, name='attendance-list-create'),
     path('<int:employee_id>/', views.attendance_by_employee, name='attendance-by-employee'),
+    path('records/<int:pk>/', views.attendance_update, name='attendance-update'),
     path('stats/', views.dashboard_stats, name='dashboard-stats'),
+    path('unmarked/', views.attendance_unmarked, name='attendance-unmarked'),
+    path('events/', views.attendance_event_ingest, name='attendance-event-ingest'),
+    path('events/compact/', views.attendance_event_compact, name='attendance-event-compact'),
+    path('hours/', views.worked_hours, name='worked-hours'),
 ]
\ No newline at end of file
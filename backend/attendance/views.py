@@ -1,19 +1,35 @@
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from .models import Attendance
-from .serializers import AttendanceSerializer
+from .compaction import compact_events
+from .models import Attendance, AttendanceEvent
+from .serializers import (
+    AttendanceBatchFilterSerializer, AttendanceEventSerializer, AttendanceSerializer, AttendanceUpdateSerializer, BulkMarkSerializer,
+    UnmarkedPageSerializer, WorkedHoursFilterSerializer,
+)
+from .signals import send_batch_saved
+from departments.models import normalize_department
 from employees.models import Employee
-from django.db import IntegrityError
-from django.db.models import Count, Q
+from django.db import IntegrityError, transaction
+from django.conf import settings
+from django.db.models import Count, Exists, FilteredRelation, OuterRef, Q, Sum
+from hrms.concurrency import conditional_update, etag_for
+from hrms.sparse import requested_fields, restrict_queryset
+from hrms.throttling import single_flight
+
+@api_view(['POST', 'GET'])
+@single_flight
+def attendance_list_create(request):
+    if request.method == 'GET':
+        return attendance_batch(request)
 
-@api_view(['POST'])
-def attendance_create(request):
     serializer = AttendanceSerializer(data=request.data)
     if serializer.is_valid():
         try:
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            attendance = serializer.save()
+            response = Response(serializer.data, status=status.HTTP_201_CREATED)
+            response['ETag'] = etag_for(attendance.updated_at)
+            return response
         except IntegrityError:
             return Response(
                 {'error': 'Attendance for this employee on this date already exists.'},
@@ -21,7 +37,56 @@ def attendance_create(request):
             )
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+def attendance_batch(request):
+    """
+    Records and present-day totals for several employees at once: one
+    grouped aggregate over the employees (which also reveals unknown ids)
+    and one fetch of their records, however many ids are asked for.
+    """
+    filters = AttendanceBatchFilterSerializer(data=request.query_params)
+    if not filters.is_valid():
+        return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+    employee_ids = filters.validated_data['employee_ids']
+    bounds = {
+        f'date__{lookup}': filters.validated_data[param]
+        for param, lookup in (('from', 'gte'), ('to', 'lte')) if param in filters.validated_data
+    }
+
+    fields, error = requested_fields(request, AttendanceSerializer)
+    if error:
+        return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+    # Like department_list: the period's rows are joined on (employee, date)
+    # and counted per employee in the same query.
+    totals = dict(
+        Employee.objects
+        .filter(id__in=employee_ids)
+        .annotate(period=FilteredRelation(
+            'attendance_records',
+            condition=Q(**{f'attendance_records__{lookup}': value for lookup, value in bounds.items()}),
+        ))
+        .annotate(present=Count('period', filter=Q(period__status='Present')))
+        .order_by()
+        .values_list('id', 'present')
+    )
+
+    records = Attendance.objects.filter(employee_id__in=list(totals), **bounds).order_by('employee_id', '-date')
+    # Grouping needs employee_id even when `fields` leaves it out.
+    records = restrict_queryset(records, AttendanceSerializer(fields=fields and fields + ['employee']))
+    grouped = {employee_id: [] for employee_id in totals}
+    for record, data in zip(records, AttendanceSerializer(records, many=True, fields=fields).data):
+        grouped[record.employee_id].append(data)
+
+    return Response({
+        'employees': [
+            {'employee': employee_id, 'attendance': grouped[employee_id], 'total_present_days': totals[employee_id]}
+            for employee_id in employee_ids if employee_id in totals
+        ],
+        'missing': [employee_id for employee_id in employee_ids if employee_id not in totals],
+    }, status=status.HTTP_200_OK)
+
 @api_view(['GET'])
+@single_flight
 def attendance_by_employee(request, employee_id):
     try:
         employee = Employee.objects.get(id=employee_id)
@@ -31,6 +96,10 @@ def attendance_by_employee(request, employee_id):
             status=status.HTTP_404_NOT_FOUND
         )
     
+    fields, error = requested_fields(request, AttendanceSerializer)
+    if error:
+        return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
     date_filter = request.query_params.get('date')
     
     attendance_records = Attendance.objects.filter(employee=employee)
@@ -40,14 +109,174 @@ def attendance_by_employee(request, employee_id):
     
     total_present = attendance_records.filter(status='Present').count()
     
-    serializer = AttendanceSerializer(attendance_records, many=True)
+    attendance_records = restrict_queryset(attendance_records, AttendanceSerializer(fields=fields))
+    serializer = AttendanceSerializer(attendance_records, many=True, fields=fields)
     
     return Response({
         'attendance': serializer.data,
         'total_present_days': total_present
     }, status=status.HTTP_200_OK)
 
+@api_view(['PATCH'])
+def attendance_update(request, pk):
+    return conditional_update(
+        request, Attendance, pk, AttendanceUpdateSerializer, 'Attendance record not found.',
+        response_serializer_class=AttendanceSerializer,
+    )
+
+def unmarked_employees(date, department=None):
+    """
+    Employees with no attendance row for `date`, as a single NOT EXISTS
+    anti-join probing the (employee, date) unique index.
+    """
+    marked = Attendance.objects.filter(employee=OuterRef('pk'), date=date)
+    employees = Employee.objects.filter(~Exists(marked))
+    if department:
+        employees = employees.filter(department__key=normalize_department(department))
+    return employees.order_by('id')
+
+@api_view(['GET', 'POST'])
+def attendance_unmarked(request):
+    if request.method == 'GET':
+        filters = UnmarkedPageSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+        params = dict(filters.validated_data)
+        after = params.pop('after')
+        limit = params.pop('limit')
+
+        # Keyset pagination on id; one extra row tells whether a next page exists.
+        page = [
+            {'id': pk, 'employee_id': employee_id, 'full_name': full_name, 'department': department}
+            for pk, employee_id, full_name, department in
+            unmarked_employees(**params)
+            .filter(id__gt=after)
+            .values_list('id', 'employee_id', 'full_name', 'department__name')[:limit + 1]
+        ]
+        has_next = len(page) > limit
+        page = page[:limit]
+        return Response({
+            'date': params['date'],
+            'employees': page,
+            'next_after': page[-1]['id'] if has_next else None,
+        }, status=status.HTTP_200_OK)
+
+    serializer = BulkMarkSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    date = serializer.validated_data['date']
+    mark_status = serializer.validated_data['status']
+
+    with transaction.atomic():
+        employee_ids = unmarked_employees(date, serializer.validated_data.get('department')).values_list('id', flat=True)
+        instances = [
+            Attendance(employee_id=employee_id, date=date, status=mark_status)
+            for employee_id in employee_ids
+        ]
+        # Rows marked concurrently since the anti-join are left untouched,
+        # and are neither counted nor announced.
+        Attendance.objects.bulk_create(instances, batch_size=1000, ignore_conflicts=True)
+        _, marked = send_batch_saved(instances)
+
+    return Response({
+        'date': date,
+        'status': mark_status,
+        'marked': len(marked),
+    }, status=status.HTTP_201_CREATED)
+
+@api_view(['POST'])
+def attendance_event_ingest(request):
+    events = request.data.get('events') if isinstance(request.data, dict) else request.data
+    if not isinstance(events, list):
+        return Response(
+            {'error': "Expected a list of events or {'events': [...]}."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(events) > settings.ATTENDANCE_EVENT_BATCH_MAX:
+        return Response(
+            {'error': f'At most {settings.ATTENDANCE_EVENT_BATCH_MAX} events per request.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    serializer = AttendanceEventSerializer(data=events, many=True)
+    if not serializer.is_valid():
+        return Response({'events': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    employee_ids = {event['employee'] for event in serializer.validated_data}
+    existing = set(Employee.objects.filter(id__in=employee_ids).values_list('id', flat=True))
+    missing = sorted(employee_ids - existing)
+    if missing:
+        return Response(
+            {'error': 'Employees do not exist.', 'employees': missing},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    AttendanceEvent.objects.bulk_create([
+        AttendanceEvent(
+            employee_id=event['employee'],
+            kind=event['kind'],
+            occurred_at=event['occurred_at'],
+            source=event['source'],
+        )
+        for event in serializer.validated_data
+    ], batch_size=1000)
+
+    return Response({'received': len(serializer.validated_data)}, status=status.HTTP_202_ACCEPTED)
+
+@api_view(['POST'])
+def attendance_event_compact(request):
+    return Response({'compacted': compact_events()}, status=status.HTTP_200_OK)
+
+@api_view(['GET'])
+@single_flight
+def worked_hours(request):
+    filters = WorkedHoursFilterSerializer(data={
+        'start': request.query_params.get('start'),
+        'end': request.query_params.get('end'),
+        'group': request.query_params.get('group', 'employee'),
+        'department': request.query_params.get('department', ''),
+    })
+    if not filters.is_valid():
+        return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+    data = filters.validated_data
+
+    records = Attendance.objects.filter(date__range=(data['start'], data['end'])).order_by()
+    if data['department']:
+        records = records.filter(employee__department__key=normalize_department(data['department']))
+
+    totals = {
+        'minutes': Sum('worked_minutes', default=0),
+        'days': Count('id', filter=Q(worked_minutes__gt=0)),
+    }
+    if data['group'] == 'department':
+        rows = [
+            {'department': row['employee__department__name'], 'employees': row['employees'],
+             'worked_minutes': row['minutes'], 'days_worked': row['days']}
+            for row in records
+            .values('employee__department__name')
+            .annotate(employees=Count('employee', distinct=True), **totals)
+            .order_by('employee__department__name')
+        ]
+    else:
+        rows = [
+            {'employee': row['employee'], 'employee_id': row['employee__employee_id'],
+             'full_name': row['employee__full_name'], 'worked_minutes': row['minutes'],
+             'days_worked': row['days']}
+            for row in records
+            .values('employee', 'employee__employee_id', 'employee__full_name')
+            .annotate(**totals)
+            .order_by('employee_id')
+        ]
+
+    return Response({
+        'start': data['start'],
+        'end': data['end'],
+        'group': data['group'],
+        'results': rows,
+    }, status=status.HTTP_200_OK)
+
 @api_view(['GET'])
+@single_flight
 def dashboard_stats(request):
     total_employees = Employee.objects.count()
     total_attendance_records = Attendance.objects.count()
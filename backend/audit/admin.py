@@ -0,0 +1,20 @@
+from django.contrib import admin
+from hrms.admin_tools import ScalableModelAdmin
+from .models import AuditEntry
+
+@admin.register(AuditEntry)
+class AuditEntryAdmin(ScalableModelAdmin):
+    list_display = ['occurred_at', 'entity', 'object_id', 'action', 'actor', 'ip_address']
+    list_filter = ['entity', 'action']
+    date_hierarchy = 'occurred_at'
+    ordering = ['-occurred_at']
+
+    # The trail is append-only, including from the admin.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
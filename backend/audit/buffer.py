@@ -0,0 +1,103 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+from hrms.metrics import increment
+
+logger = logging.getLogger('audit')
+
+
+class AuditBuffer:
+    """
+    Collects unsaved AuditEntry rows in memory and writes them with
+    bulk_create from a background thread, every AUDIT_FLUSH_INTERVAL
+    seconds or as soon as AUDIT_BATCH_SIZE entries are waiting.
+
+    Once AUDIT_BUFFER_MAX entries are pending the producing thread flushes
+    inline, so a slow database slows writers down instead of growing the
+    buffer; entries are only dropped if that flush fails too. The thread is
+    started per process, so workers forked from a preloaded master get
+    their own, and whatever is left is flushed at exit.
+    """
+
+    def __init__(self):
+        self._entries = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pid = None
+
+    def _ensure_thread(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # Entries inherited across fork belong to the parent.
+            self._entries = []
+            self._flush_lock = threading.Lock()
+            self._wakeup = threading.Event()
+            threading.Thread(target=self._run, name='audit-flush', daemon=True).start()
+            atexit.register(self.flush)
+            self._pid = os.getpid()
+
+    def add(self, entry):
+        self._ensure_thread()
+        with self._lock:
+            self._entries.append(entry)
+            pending = len(self._entries)
+        if pending >= settings.AUDIT_BUFFER_MAX:
+            increment('audit_backpressure')
+            if not self.flush():
+                self._drop_overflow()
+        elif pending >= settings.AUDIT_BATCH_SIZE:
+            self._wakeup.set()
+
+    def pending(self):
+        with self._lock:
+            return len(self._entries)
+
+    def flush(self):
+        """Write everything pending. Returns False if a batch could not be saved."""
+        from .models import AuditEntry
+
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = self._entries[:settings.AUDIT_BATCH_SIZE]
+                    del self._entries[:len(batch)]
+                if not batch:
+                    return True
+                try:
+                    AuditEntry.objects.bulk_create(batch)
+                except Exception:
+                    logger.exception('Failed to write %d audit entries', len(batch))
+                    # Keep them for the next attempt, ahead of newer entries.
+                    with self._lock:
+                        self._entries[:0] = batch
+                    return False
+                increment('audit_written', len(batch))
+
+    def _drop_overflow(self):
+        with self._lock:
+            overflow = len(self._entries) - settings.AUDIT_BUFFER_MAX
+            if overflow <= 0:
+                return
+            del self._entries[:overflow]
+        increment('audit_dropped', overflow)
+        logger.error('Audit buffer full; dropped the %d oldest entries', overflow)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(settings.AUDIT_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            # This thread outlives requests, so recycle its connection the
+            # way request_finished does for request threads.
+            close_old_connections()
+            self.flush()
+
+
+audit_buffer = AuditBuffer()
@@ -0,0 +1,17 @@
+import contextvars
+
+current_request = contextvars.ContextVar('audit_request', default=None)
+
+
+class AuditContextMiddleware:
+    """Makes the current request available to the audit signal handlers."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = current_request.set(request)
+        try:
+            return self.get_response(request)
+        finally:
+            current_request.reset(token)
@@ -0,0 +1,78 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:36
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entity",
+                    models.CharField(
+                        choices=[
+                            ("employee", "Employee"),
+                            ("attendance", "Attendance"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("updated", "Updated"),
+                            ("deleted", "Deleted"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("actor", models.CharField(blank=True, max_length=150)),
+                ("ip_address", models.GenericIPAddressField(blank=True, null=True)),
+                ("request_id", models.CharField(blank=True, max_length=64)),
+                (
+                    "changes",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                ("occurred_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "audit_log",
+                "ordering": ["-occurred_at", "-id"],
+                "indexes": [
+                    models.Index(
+                        fields=["entity", "occurred_at"],
+                        name="audit_log_entity_c64a7f_idx",
+                    ),
+                    models.Index(
+                        fields=["entity", "object_id", "occurred_at"],
+                        name="audit_log_entity_837205_idx",
+                    ),
+                    models.Index(
+                        fields=["occurred_at"], name="audit_log_occurre_02ec46_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+class AuditEntry(models.Model):
+    """
+    Append-only record of who created, changed or deleted an employee or
+    attendance row. Written in batches by audit.buffer, never updated.
+    """
+    ENTITY_CHOICES = [
+        ('employee', 'Employee'),
+        ('attendance', 'Attendance'),
+    ]
+    ACTION_CHOICES = [
+        ('created', 'Created'),
+        ('updated', 'Updated'),
+        ('deleted', 'Deleted'),
+    ]
+
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    actor = models.CharField(max_length=150, blank=True)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    request_id = models.CharField(max_length=64, blank=True)
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    occurred_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'audit_log'
+        ordering = ['-occurred_at', '-id']
+        indexes = [
+            models.Index(fields=['entity', 'occurred_at']),
+            models.Index(fields=['entity', 'object_id', 'occurred_at']),
+            models.Index(fields=['occurred_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.entity} {self.object_id} {self.action} by {self.actor or 'system'} at {self.occurred_at}"
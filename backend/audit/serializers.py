@@ -0,0 +1,22 @@
+from rest_framework import serializers
+from .models import AuditEntry
+
+class AuditEntrySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AuditEntry
+        fields = ['id', 'entity', 'object_id', 'action', 'actor', 'ip_address', 'request_id', 'changes', 'occurred_at']
+
+class AuditFilterSerializer(serializers.Serializer):
+    entity = serializers.ChoiceField(choices=AuditEntry.ENTITY_CHOICES, required=False)
+    object_id = serializers.IntegerField(required=False)
+    action = serializers.ChoiceField(choices=AuditEntry.ACTION_CHOICES, required=False)
+    actor = serializers.CharField(required=False)
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+    before = serializers.RegexField(r'^\d+\.\d+$', required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+    def validate(self, data):
+        if 'object_id' in data and 'entity' not in data:
+            raise serializers.ValidationError("object_id requires entity.")
+        return data
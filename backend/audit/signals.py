@@ -0,0 +1,85 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework.throttling import BaseThrottle
+from attendance.models import Attendance
+from attendance.signals import attendance_batch_saved
+from employees.models import Employee
+from hrms.structured_logging import request_id
+from .buffer import audit_buffer
+from .middleware import current_request
+from .models import AuditEntry
+
+ENTITIES = {Employee: 'employee', Attendance: 'attendance'}
+_SKIPPED_FIELDS = {'id', 'created_at', 'updated_at'}
+
+
+def _snapshot(instance, fields=None):
+    return {
+        field.attname: getattr(instance, field.attname)
+        for field in instance._meta.concrete_fields
+        if field.name not in _SKIPPED_FIELDS and (fields is None or field.name in fields)
+    }
+
+
+def _actor():
+    """(actor, ip_address) for the request being served, or blanks for jobs."""
+    request = current_request.get()
+    if request is None:
+        return '', None
+    user = getattr(request, 'user', None)
+    actor = user.get_username() if user is not None and user.is_authenticated else 'anonymous'
+    ip_address = BaseThrottle().get_ident(request).split(',')[0].strip() or None
+    return actor, ip_address
+
+
+def _record(entries):
+    # Only committed changes are audited; entries join the buffer on commit.
+    transaction.on_commit(lambda: [audit_buffer.add(entry) for entry in entries])
+
+
+def _entry(instance, action, changes, actor):
+    return AuditEntry(
+        entity=ENTITIES[type(instance)],
+        object_id=instance.pk,
+        action=action,
+        actor=actor[0],
+        ip_address=actor[1],
+        request_id=request_id.get() or '',
+        changes=changes,
+        occurred_at=timezone.now(),
+    )
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Attendance)
+def audit_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        entry = _entry(instance, 'created', _snapshot(instance), _actor())
+    else:
+        # Conditional PATCH updates name the columns they changed.
+        changed = set(update_fields) - _SKIPPED_FIELDS if update_fields else None
+        entry = _entry(instance, 'updated', _snapshot(instance, changed), _actor())
+    _record([entry])
+
+
+@receiver(post_delete, sender=Employee)
+@receiver(post_delete, sender=Attendance)
+def audit_deleted(sender, instance, **kwargs):
+    _record([_entry(instance, 'deleted', _snapshot(instance), _actor())])
+
+
+@receiver(attendance_batch_saved, sender=Attendance)
+def audit_batch(sender, instances, created, update_fields, **kwargs):
+    # Only rows the batch wrote are sent, with their pks read back by
+    # (employee, date); rows skipped on conflict are not audited. Upserted
+    # rows only record the columns the upsert overwrote.
+    actor = _actor()
+    inserted = {id(instance) for instance in created}
+    changed = set(update_fields) - _SKIPPED_FIELDS
+    _record([
+        _entry(instance, 'created', _snapshot(instance), actor) if id(instance) in inserted
+        else _entry(instance, 'updated', _snapshot(instance, changed), actor)
+        for instance in instances
+    ])
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from .models import AuditEntry
+from .serializers import AuditEntrySerializer, AuditFilterSerializer
+
+
+def make_cursor(entry):
+    return f'{int(entry.occurred_at.timestamp() * 1_000_000)}.{entry.pk}'
+
+
+def parse_cursor(cursor):
+    micros, pk = cursor.split('.')
+    return datetime.fromtimestamp(int(micros) / 1_000_000, tz=dt_timezone.utc), int(pk)
+
+
+@api_view(['GET'])
+def audit_list(request):
+    filters = AuditFilterSerializer(data=request.query_params)
+    if not filters.is_valid():
+        return Response(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+    data = filters.validated_data
+
+    # Filters line up with the (entity, object_id, occurred_at) and
+    # (entity, occurred_at) indexes; newest first.
+    entries = AuditEntry.objects.order_by('-occurred_at', '-id')
+    for field in ('entity', 'object_id', 'action', 'actor'):
+        if field in data:
+            entries = entries.filter(**{field: data[field]})
+    if 'since' in data:
+        entries = entries.filter(occurred_at__gte=data['since'])
+    if 'until' in data:
+        entries = entries.filter(occurred_at__lt=data['until'])
+    if 'before' in data:
+        try:
+            occurred_at, pk = parse_cursor(data['before'])
+        except (ValueError, OverflowError, OSError):
+            return Response(
+                {'error': 'Invalid cursor.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        entries = entries.filter(Q(occurred_at__lt=occurred_at) | Q(occurred_at=occurred_at, id__lt=pk))
+
+    limit = data['limit']
+    page = list(entries[:limit + 1])
+    has_next = len(page) > limit
+    page = page[:limit]
+    return Response({
+        'results': AuditEntrySerializer(page, many=True).data,
+        'next_before': make_cursor(page[-1]) if has_next else None,
+    }, status=status.HTTP_200_OK)
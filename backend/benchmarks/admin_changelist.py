@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Admin changelist render time for attendance and employees on a seeded
+database, with the default ModelAdmin settings the project started with
+against the registered scale-safe admins.
+
+    python benchmarks/admin_changelist.py [--employees 30000] [--days 34] [--runs 3]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from seed import seed, setup_django
+
+
+def render(model_admin, factory, user, query, runs):
+    timings = []
+    for _ in range(runs):
+        request = factory.get('/', query)
+        request.user = user
+        start = time.perf_counter()
+        response = model_admin.changelist_view(request)
+        response.render()
+        timings.append((time.perf_counter() - start) * 1000)
+    assert response.status_code == 200, response.status_code
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=30000)
+    parser.add_argument('--days', type=int, default=34)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(Path(tmp) / 'bench.sqlite3')
+        seed(args.employees, days=args.days)
+
+        from django.contrib import admin
+        from django.contrib.auth.models import User
+        from django.test import RequestFactory
+        from attendance.models import Attendance
+        from employees.models import Employee
+
+        baseline = {
+            Attendance: type('DefaultAttendanceAdmin', (admin.ModelAdmin,), {
+                'list_display': ['employee', 'date', 'status', 'created_at'],
+                'search_fields': ['employee__full_name', 'employee__employee_id'],
+                'list_filter': ['status', 'date', 'created_at'],
+                'ordering': ['-date'],
+            })(Attendance, admin.site),
+            Employee: type('DefaultEmployeeAdmin', (admin.ModelAdmin,), {
+                'list_display': ['employee_id', 'full_name', 'email', 'department', 'created_at'],
+                'search_fields': ['employee_id', 'full_name', 'email', 'department__name'],
+                'list_filter': ['department', 'created_at'],
+                'ordering': ['-created_at'],
+            })(Employee, admin.site),
+        }
+        user = User.objects.create_superuser('bench', 'bench@example.com', 'bench')
+        factory = RequestFactory()
+        day = Attendance.objects.order_by('-date').values_list('date', flat=True).first()
+        cases = [
+            (Attendance, 'first page', {}),
+            (Attendance, 'status filter', {'status__exact': 'Absent'}),
+            (Attendance, 'single day', {'date__year': day.year, 'date__month': day.month, 'date__day': day.day}),
+            (Attendance, 'search id', {'q': 'EMP0001234'}),
+            (Employee, 'first page', {}),
+            (Employee, 'search name', {'q': 'Employee 1234'}),
+        ]
+
+        print(f'{Attendance.objects.count():,} attendance rows, {args.employees:,} employees')
+        print(f"{'changelist':<28} {'default ms':>11} {'scalable ms':>12}")
+        for model, label, query in cases:
+            # The default admin has no date hierarchy; filter the day directly.
+            default_query = {'date': day.isoformat()} if label == 'single day' else query
+            default = render(baseline[model], factory, user, default_query, args.runs)
+            scalable = render(admin.site._registry[model], factory, user, query, args.runs)
+            print(f"{f'{model.__name__} {label}':<28} {default:>11.1f} {scalable:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+GET /api/analytics/ on a seeded 10M-row attendance table: the grouped,
+chunked NumPy pass on a cache miss and a cached hit, against pulling every
+row into Python and counting per (department, day) in a loop.
+
+    python benchmarks/analytics.py [--employees 27400] [--days 365] [--skip-rows]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from seed import seed, setup_django
+
+
+def seed_attendance(days):
+    """One row per employee per day, generated inside SQLite (bulk_create is far too slow for 10M rows)."""
+    from django.db import connection
+    from django.utils import timezone
+
+    yesterday = timezone.localdate() - timedelta(days=1)
+    now = timezone.now().isoformat()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            WITH RECURSIVE offsets(n) AS (SELECT 0 UNION ALL SELECT n + 1 FROM offsets WHERE n < %s)
+            INSERT INTO attendance (employee_id, date, status, created_at, updated_at)
+            SELECT employees.id, date(%s, '-' || offsets.n || ' days'),
+                   CASE WHEN abs(random()) %% 10 = 0 THEN 'Absent' ELSE 'Present' END, %s, %s
+            FROM employees CROSS JOIN offsets
+            """,
+            [days - 1, yesterday.isoformat(), now, now],
+        )
+
+
+def row_by_row(window, history_days):
+    from django.utils import timezone
+    from attendance.models import Attendance
+
+    end = timezone.localdate()
+    start = end - timedelta(days=history_days + window - 2)
+    counts = {}
+    rows = Attendance.objects.filter(date__range=(start, end)).values_list('employee__department_id', 'date', 'status')
+    for department_id, day, record_status in rows.iterator(chunk_size=10000):
+        key = (department_id, day, record_status)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=27400)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--skip-rows', action='store_true', help='Skip the row-by-row baseline.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(Path(tmp) / 'bench.sqlite3')
+        seed(args.employees)
+        start = time.perf_counter()
+        seed_attendance(args.days)
+        print(f'seeded in {time.perf_counter() - start:.1f}s')
+
+        from django.conf import settings
+        from django.test import Client
+        from attendance.models import Attendance
+
+        client = Client()
+        print(f'{Attendance.objects.count():,} attendance rows')
+        for label, url in (('cache miss', '/api/analytics/?window=30'),
+                           ('cache hit', '/api/analytics/?window=30'),
+                           ('cache hit, department', '/api/analytics/?window=30&department=sales')):
+            start = time.perf_counter()
+            response = client.get(url)
+            assert response.status_code == 200, response.status_code
+            print(f'{label:<24} {(time.perf_counter() - start) * 1000:>10.1f} ms')
+
+        if not args.skip_rows:
+            start = time.perf_counter()
+            row_by_row(30, settings.ANALYTICS_HISTORY_DAYS)
+            print(f"{'row-by-row counting':<24} {(time.perf_counter() - start) * 1000:>10.1f} ms (counts only)")
+
+
+if __name__ == '__main__':
+    main()
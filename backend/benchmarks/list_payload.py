@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Payload size and latency of GET /api/employees/ with and without sparse
+fieldsets and response compression, on a seeded 50k-employee database.
+
+    python benchmarks/list_payload.py [--employees 50000] [--runs 5]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from seed import seed, setup_django
+
+
+def measure(client, url, encoding, runs):
+    headers = {'HTTP_ACCEPT_ENCODING': encoding} if encoding else {}
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        response = client.get(url, **headers)
+        timings.append((time.perf_counter() - start) * 1000)
+    assert response.status_code == 200, response.status_code
+    return len(response.content), statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=50000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(Path(tmp) / 'bench.sqlite3')
+        seed(args.employees)
+
+        from django.test import Client
+        client = Client()
+
+        print(f"{'query':<40} {'encoding':<9} {'bytes':>12} {'median ms':>10}")
+        for query in ('', '?fields=id,employee_id,full_name'):
+            for encoding in ('', 'gzip', 'br'):
+                size, latency = measure(client, f'/api/employees/{query}', encoding, args.runs)
+                print(f"{query or '(all fields)':<40} {encoding or 'identity':<9} {size:>12,} {latency:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
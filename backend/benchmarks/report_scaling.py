@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Month-end attendance report: one query per employee (what paging through
+/api/attendance/<id>/ amounts to) against the sharded generator at
+increasing worker counts.
+
+    python benchmarks/report_scaling.py [--employees 20000] [--workers 1,2,4,8]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from seed import seed, setup_django
+
+MONTH = '2026-01'
+
+
+def per_employee(first, last):
+    from attendance.models import Attendance
+    from employees.models import Employee
+
+    for employee_id in Employee.objects.order_by('id').values_list('id', flat=True):
+        statuses = list(
+            Attendance.objects.filter(employee_id=employee_id, date__range=(first, last)).values_list('status', flat=True)
+        )
+        statuses.count('Present')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=20000)
+    parser.add_argument('--workers', default=','.join(str(n) for n in (1, 2, 4, 8) if n <= (os.cpu_count() or 1)))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(Path(tmp) / 'bench.sqlite3')
+        seed(args.employees, days=31, start=date(2026, 1, 31))
+
+        from reports.generator import generate_report, parse_month
+
+        print(f'{args.employees:,} employees x 31 days, {os.cpu_count()} CPU(s)')
+        start = time.perf_counter()
+        per_employee(*parse_month(MONTH))
+        baseline = time.perf_counter() - start
+        print(f"{'per-employee queries':<24} {baseline:>8.2f}s")
+
+        for workers in (int(value) for value in args.workers.split(',')):
+            start = time.perf_counter()
+            _, rows = generate_report(MONTH, output=Path(tmp) / f'report-{workers}.csv', workers=workers)
+            elapsed = time.perf_counter() - start
+            assert rows == args.employees, rows
+            print(f"{f'sharded, {workers} worker(s)':<24} {elapsed:>8.2f}s  {baseline / elapsed:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
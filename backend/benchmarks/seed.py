@@ -0,0 +1,79 @@
+"""
+Shared helpers for benchmarks that need a populated database. Django is
+pointed at a throwaway SQLite file before setup, so the real database is
+never touched.
+"""
+
+import os
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEPARTMENTS = ['Engineering', 'Sales', 'Operations', 'Finance', 'Support', 'Marketing', 'HR', 'Legal']
+
+
+def setup_django(db_path):
+    sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hrms.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    os.environ['LOG_SAMPLE_RATE'] = '0'
+    os.environ['WRITE_THROTTLE_RATE'] = '1000000'
+    from hrms import settings
+
+    settings.DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': str(db_path)}}
+    settings.ALLOWED_HOSTS = ['*']
+
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+
+def seed(employees, days=0, start=None, batch_size=5000):
+    """
+    Insert `employees` employees and one attendance row per employee per day
+    for `days` days ending at `start` (default: yesterday). Uses bulk inserts
+    with signals bypassed, so counters are fixed up at the end.
+    """
+    from attendance.models import Attendance
+    from departments.models import Department
+    from departments.signals import recount_departments
+    from employees.models import Employee
+
+    rng = random.Random(42)
+    departments = [Department.objects.get_or_create_by_name(name) for name in DEPARTMENTS]
+
+    existing = Employee.objects.count()
+    for offset in range(existing, employees, batch_size):
+        Employee.objects.bulk_create([
+            Employee(
+                employee_id=f'EMP{index:07d}',
+                full_name=f'Employee {index}',
+                email=f'employee{index}@example.com',
+                department=departments[index % len(departments)],
+            )
+            for index in range(offset, min(offset + batch_size, employees))
+        ])
+    recount_departments()
+
+    if not days:
+        return
+    start = start or date.today() - timedelta(days=1)
+    employee_ids = list(Employee.objects.order_by('id').values_list('id', flat=True))
+    batch = []
+    for day in range(days):
+        current = start - timedelta(days=day)
+        for employee_id in employee_ids:
+            batch.append(Attendance(
+                employee_id=employee_id,
+                date=current,
+                status='Present' if rng.random() < 0.9 else 'Absent',
+            ))
+            if len(batch) >= batch_size:
+                Attendance.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+    if batch:
+        Attendance.objects.bulk_create(batch, ignore_conflicts=True)
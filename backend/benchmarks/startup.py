@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Cold-start and per-worker memory benchmark for the backend.
+
+Compares the full Django profile with API_ONLY=True, and gunicorn with and
+without --preload. Run from the backend directory:
+
+    python benchmarks/startup.py [--runs 5] [--skip-gunicorn]
+"""
+
+import argparse
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+COLD_START = """
+import resource, time
+start = time.perf_counter()
+from hrms.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def profile_env(api_only):
+    env = dict(os.environ)
+    env['API_ONLY'] = 'True' if api_only else 'False'
+    env.setdefault('SECRET_KEY', 'benchmark')
+    return env
+
+
+def cold_start(api_only, runs):
+    timings, rss = [], []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, '-c', COLD_START], cwd=BACKEND_DIR, env=profile_env(api_only), text=True
+        )
+        elapsed, maxrss = output.split()
+        timings.append(float(elapsed))
+        rss.append(int(maxrss))
+    return statistics.median(timings), statistics.median(rss)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def memory_kb(pid):
+    values = {}
+    with open(f'/proc/{pid}/smaps_rollup') as smaps:
+        for line in smaps:
+            key, _, rest = line.partition(':')
+            if key in ('Rss', 'Pss'):
+                values[key] = int(rest.split()[0])
+    return values
+
+
+def worker_pids(master_pid):
+    with open(f'/proc/{master_pid}/task/{master_pid}/children') as children:
+        return [int(pid) for pid in children.read().split()]
+
+
+def gunicorn_memory(api_only, preload, workers=3):
+    port = free_port()
+    env = profile_env(api_only)
+    env.update({'PORT': str(port), 'WEB_CONCURRENCY': str(workers), 'GUNICORN_PRELOAD': str(preload)})
+    start = time.perf_counter()
+    master = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', 'hrms.wsgi:application', '-c', 'gunicorn.conf.py'],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        ready = None
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            try:
+                # Enough requests that every worker has served at least one.
+                for _ in range(workers * 4):
+                    urllib.request.urlopen(f'http://127.0.0.1:{port}/api/metrics/', timeout=5).read()
+                ready = time.perf_counter() - start
+                break
+            except OSError:
+                time.sleep(0.05)
+        if ready is None:
+            raise RuntimeError('gunicorn did not become ready')
+        pids = worker_pids(master.pid)
+        memory = [memory_kb(pid) for pid in pids]
+        return ready, statistics.mean(m['Rss'] for m in memory), statistics.mean(m['Pss'] for m in memory)
+    finally:
+        master.send_signal(signal.SIGTERM)
+        master.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--skip-gunicorn', action='store_true')
+    args = parser.parse_args()
+
+    print(f"{'profile':<10} {'cold start (s)':>15} {'max RSS (MiB)':>15}")
+    for api_only in (False, True):
+        elapsed, maxrss = cold_start(api_only, args.runs)
+        print(f"{'api-only' if api_only else 'full':<10} {elapsed:>15.3f} {maxrss / 1024:>15.1f}")
+
+    if args.skip_gunicorn:
+        return
+
+    print()
+    print(f"{'profile':<10} {'preload':<8} {'ready (s)':>10} {'worker RSS (MiB)':>17} {'worker PSS (MiB)':>17}")
+    for api_only in (False, True):
+        for preload in (False, True):
+            ready, rss, pss = gunicorn_memory(api_only, preload)
+            print(f"{'api-only' if api_only else 'full':<10} {str(preload):<8} {ready:>10.2f} "
+                  f"{rss / 1024:>17.1f} {pss / 1024:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
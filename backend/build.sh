@@ -0,0 +1,15 @@
+#!/bin/bash
+set -e
+
+echo "Building Django application..."
+
+cd "$(dirname "$0")"
+
+pip install -r requirements.txt
+
+python manage.py migrate --noinput
+
+# Static files only exist for the admin; the API-only profile has none.
+if [ "$API_ONLY" != "True" ]; then
+    python manage.py collectstatic --noinput --clear
+fi
@@ -0,0 +1,31 @@
+"""
+One-time conversion of status checks written with ISO string timestamps to
+BSON dates, which server.py sorts and pages on. Safe to re-run; documents
+already holding dates are not matched.
+
+    python convert_status_timestamps.py
+"""
+
+import asyncio
+
+from server import client, db
+
+
+async def convert(database):
+    result = await database.status_checks.update_many(
+        {"timestamp": {"$type": "string"}},
+        [{"$set": {"timestamp": {"$toDate": "$timestamp"}}}],
+    )
+    return result.modified_count
+
+
+def main():
+    try:
+        converted = asyncio.run(convert(db))
+    finally:
+        client.close()
+    print(f"Converted {converted} status check(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import Department
+
+@admin.register(Department)
+class DepartmentAdmin(admin.ModelAdmin):
+    list_display = ['name', 'employee_count', 'created_at']
+    search_fields = ['name']
+    readonly_fields = ['key', 'employee_count']
+    ordering = ['name']
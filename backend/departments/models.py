@@ -0,0 +1,34 @@
+from django.db import models
+
+
+def normalize_department(name):
+    """Lookup key that folds case and whitespace so typos do not split departments."""
+    return ' '.join(name.split()).casefold()
+
+
+class DepartmentManager(models.Manager):
+    def get_or_create_by_name(self, name):
+        name = ' '.join(name.split())
+        department, _ = self.get_or_create(key=normalize_department(name), defaults={'name': name})
+        return department
+
+
+class Department(models.Model):
+    name = models.CharField(max_length=100)
+    key = models.CharField(max_length=100, unique=True)
+    # Denormalized headcount, maintained from Employee signals.
+    employee_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = DepartmentManager()
+
+    class Meta:
+        db_table = 'departments'
+        ordering = ['name']
+
+    def save(self, *args, **kwargs):
+        self.key = normalize_department(self.name)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,29 @@
+from rest_framework import serializers
+from .models import Department
+
+class DepartmentField(serializers.Field):
+    """
+    Reads and writes a department by name, as the old free-text field did.
+    Names that differ only in case or spacing resolve to the same department.
+    Validation only normalizes the name; the serializer resolves it with
+    resolve() inside its write, so rejected requests create nothing.
+    """
+    related_columns = ['name']
+    default_error_messages = {
+        'required': 'Department is required.',
+        'blank': 'Department is required.',
+        'max_length': 'Ensure this field has no more than 100 characters.',
+    }
+
+    def to_representation(self, value):
+        return value.name
+
+    def to_internal_value(self, data):
+        if not isinstance(data, str) or not data.strip():
+            self.fail('blank')
+        if len(data.strip()) > 100:
+            self.fail('max_length')
+        return ' '.join(data.split())
+
+    def resolve(self, name):
+        return Department.objects.get_or_create_by_name(name)
@@ -0,0 +1,45 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from employees.models import Employee
+from .models import Department
+
+
+def recount_departments():
+    headcount = (
+        Employee.objects.filter(department=OuterRef('pk'))
+        .order_by()
+        .values('department')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Department.objects.update(employee_count=Coalesce(Subquery(headcount), 0))
+
+
+@receiver(pre_save, sender=Employee)
+def employee_saving(sender, instance, using, update_fields=None, **kwargs):
+    """Remember the department an existing employee is saved away from."""
+    if instance.pk is None or (update_fields is not None and 'department' not in update_fields):
+        return
+    rows = Employee.objects.using(using).filter(pk=instance.pk)
+    if transaction.get_connection(using).in_atomic_block:
+        # Hold the row until the save commits, so concurrent moves are counted in turn.
+        rows = rows.select_for_update()
+    instance._previous_department_id = rows.values_list('department_id', flat=True).first()
+
+
+@receiver(post_save, sender=Employee)
+def employee_saved(sender, instance, created, **kwargs):
+    previous = instance.__dict__.pop('_previous_department_id', None)
+    if created:
+        Department.objects.filter(pk=instance.department_id).update(employee_count=F('employee_count') + 1)
+    elif previous is not None and previous != instance.department_id:
+        Department.objects.filter(pk=previous).update(employee_count=F('employee_count') - 1)
+        Department.objects.filter(pk=instance.department_id).update(employee_count=F('employee_count') + 1)
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    Department.objects.filter(pk=instance.department_id).update(employee_count=F('employee_count') - 1)
@@ -0,0 +1,48 @@
+from django.db.models import Count, FilteredRelation, Q
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from hrms.throttling import single_flight
+from .models import Department
+
+@api_view(['GET'])
+@single_flight
+def department_list(request):
+    date_param = request.query_params.get('date')
+    if date_param:
+        try:
+            date = serializers.DateField().to_internal_value(date_param)
+        except serializers.ValidationError as exc:
+            return Response({'date': exc.detail}, status=status.HTTP_400_BAD_REQUEST)
+    else:
+        date = timezone.localdate()
+
+    # One query: headcount is the denormalized counter, and the day's
+    # attendance is joined on (employee, date) and counted per department.
+    departments = (
+        Department.objects
+        .annotate(day=FilteredRelation(
+            'employees__attendance_records',
+            condition=Q(employees__attendance_records__date=date),
+        ))
+        .annotate(
+            present=Count('day', filter=Q(day__status='Present')),
+            absent=Count('day', filter=Q(day__status='Absent')),
+        )
+        .values('id', 'name', 'employee_count', 'present', 'absent')
+    )
+
+    return Response({
+        'date': date,
+        'departments': [
+            {
+                'id': department['id'],
+                'name': department['name'],
+                'headcount': department['employee_count'],
+                'present': department['present'],
+                'absent': department['absent'],
+            }
+            for department in departments
+        ],
+    }, status=status.HTTP_200_OK)
@@ -1,9 +1,15 @@
 from django.contrib import admin
+from hrms.admin_tools import EmployeeSearchMixin, ScalableModelAdmin
 from .models import Employee
 
 @admin.register(Employee)
-class EmployeeAdmin(admin.ModelAdmin):
+class EmployeeAdmin(EmployeeSearchMixin, ScalableModelAdmin):
     list_display = ['employee_id', 'full_name', 'email', 'department', 'created_at']
-    search_fields = ['employee_id', 'full_name', 'email', 'department']
-    list_filter = ['department', 'created_at']
-    ordering = ['-created_at']
\ No newline at end of file
+    # Exact employee id or email, or a full name prefix (see EmployeeSearchMixin).
+    search_fields = ['employee_id', 'email', 'full_name']
+    employee_lookup = 'pk'
+    list_filter = ['department']
+    list_select_related = ['department']
+    autocomplete_fields = ['department']
+    date_hierarchy = 'created_at'
+    ordering = ['-created_at']
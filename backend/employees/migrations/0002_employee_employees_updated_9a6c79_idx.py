@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(
+                fields=["updated_at"], name="employees_updated_9a6c79_idx"
+            ),
+        ),
+    ]
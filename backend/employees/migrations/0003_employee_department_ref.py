@@ -0,0 +1,31 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("departments", "0001_initial"),
+        ("employees", "0002_employee_employees_updated_9a6c79_idx"),
+    ]
+
+    operations = [
+        # Nullable so 0005 can be reversed onto a populated table.
+        migrations.AlterField(
+            model_name="employee",
+            name="department",
+            field=models.CharField(max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="department_ref",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="departments.department",
+            ),
+        ),
+    ]
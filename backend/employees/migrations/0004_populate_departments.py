@@ -0,0 +1,54 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:15
+
+from collections import Counter, defaultdict
+
+from django.db import migrations
+from django.db.models import Count
+
+
+def normalize(name):
+    return " ".join(name.split()).casefold()
+
+
+def populate_departments(apps, schema_editor):
+    Department = apps.get_model("departments", "Department")
+    Employee = apps.get_model("employees", "Employee")
+
+    # Group spellings that differ only in case or whitespace.
+    groups = defaultdict(Counter)
+    for row in (
+        Employee.objects.order_by().values("department").annotate(total=Count("id"))
+    ):
+        raw_name = row["department"] or ""
+        groups[normalize(raw_name)][raw_name] += row["total"]
+
+    for key, spellings in groups.items():
+        # The most common spelling becomes the department name.
+        name = " ".join(spellings.most_common(1)[0][0].split()) or "Unassigned"
+        department, _ = Department.objects.update_or_create(
+            key=key or normalize(name),
+            defaults={"name": name, "employee_count": sum(spellings.values())},
+        )
+        Employee.objects.filter(department__in=list(spellings)).update(
+            department_ref=department
+        )
+
+
+def restore_department_names(apps, schema_editor):
+    Department = apps.get_model("departments", "Department")
+    Employee = apps.get_model("employees", "Employee")
+    for department in Department.objects.all():
+        Employee.objects.filter(department_ref=department).update(
+            department=department.name
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0003_employee_department_ref"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_departments, restore_department_names),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("departments", "0001_initial"),
+        ("employees", "0004_populate_departments"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="employee",
+            name="department",
+        ),
+        migrations.RenameField(
+            model_name="employee",
+            old_name="department_ref",
+            new_name="department",
+        ),
+        migrations.AlterField(
+            model_name="employee",
+            name="department",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="employees",
+                to="departments.department",
+            ),
+        ),
+    ]
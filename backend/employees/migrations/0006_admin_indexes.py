@@ -0,0 +1,28 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("departments", "0001_initial"),
+        ("employees", "0005_employee_department_fk"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(
+                fields=["created_at"], name="employees_created_7bd894_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(
+                fields=["full_name"],
+                name="employees_full_name_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ),
+    ]
@@ -1,11 +1,12 @@
 from django.db import models
 from django.core.validators import EmailValidator
+from departments.models import Department
 
 class Employee(models.Model):
     employee_id = models.CharField(max_length=50, unique=True, db_index=True)
     full_name = models.CharField(max_length=200)
     email = models.EmailField(unique=True, validators=[EmailValidator()])
-    department = models.CharField(max_length=100)
+    department = models.ForeignKey(Department, on_delete=models.PROTECT, related_name='employees')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -15,6 +16,10 @@ class Employee(models.Model):
         indexes = [
             models.Index(fields=['employee_id']),
             models.Index(fields=['email']),
+            models.Index(fields=['updated_at']),
+            models.Index(fields=['created_at']),
+            # Prefix search in the admin; pattern ops let PostgreSQL use it for LIKE 'x%'.
+            models.Index(fields=['full_name'], name='employees_full_name_idx', opclasses=['varchar_pattern_ops']),
         ]
     
     def __str__(self):
@@ -1,9 +1,14 @@
 from rest_framework import serializers
 from .models import Employee
+from departments.serializers import DepartmentField
+from hrms.sparse import SparseFieldsetMixin
 from django.core.validators import EmailValidator
 from django.core.exceptions import ValidationError
+from django.db import transaction
+
+class EmployeeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    department = DepartmentField()
 
-class EmployeeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Employee
         fields = ['id', 'employee_id', 'full_name', 'email', 'department', 'created_at', 'updated_at']
@@ -30,11 +35,20 @@ class EmployeeSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Enter a valid email address.")
         return value
     
-    def validate_department(self, value):
-        if not value or not value.strip():
-            raise serializers.ValidationError("Department is required.")
-        return value.strip()
-    
+    def resolve_related(self, validated_data):
+        """Swap the validated department name for its Department, creating it if new."""
+        if 'department' in validated_data:
+            validated_data['department'] = self.fields['department'].resolve(validated_data['department'])
+        return validated_data
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            return super().create(self.resolve_related(validated_data))
+
+    def update(self, instance, validated_data):
+        with transaction.atomic():
+            return super().update(instance, self.resolve_related(validated_data))
+
     def validate(self, data):
         if self.instance is None:
             if Employee.objects.filter(employee_id=data.get('employee_id')).exists():
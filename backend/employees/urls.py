@@ -3,5 +3,5 @@ from . import views
 
 urlpatterns = [
     path('', views.employee_list_create, name='employee-list-create'),
-    path('<int:pk>/', views.employee_delete, name='employee-delete'),
+    path('<int:pk>/', views.employee_detail, name='employee-detail'),
 ]
\ No newline at end of file
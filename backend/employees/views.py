@@ -4,20 +4,29 @@ from rest_framework.response import Response
 from .models import Employee
 from .serializers import EmployeeSerializer
 from django.db import IntegrityError
+from hrms.concurrency import conditional_update, etag_for
+from hrms.sparse import requested_fields, restrict_queryset
+from hrms.throttling import single_flight
 
 @api_view(['POST', 'GET'])
+@single_flight
 def employee_list_create(request):
     if request.method == 'GET':
-        employees = Employee.objects.all()
-        serializer = EmployeeSerializer(employees, many=True)
+        fields, error = requested_fields(request, EmployeeSerializer)
+        if error:
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+        employees = restrict_queryset(Employee.objects.all(), EmployeeSerializer(fields=fields))
+        serializer = EmployeeSerializer(employees, many=True, fields=fields)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
     elif request.method == 'POST':
         serializer = EmployeeSerializer(data=request.data)
         if serializer.is_valid():
             try:
-                serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
+                employee = serializer.save()
+                response = Response(serializer.data, status=status.HTTP_201_CREATED)
+                response['ETag'] = etag_for(employee.updated_at)
+                return response
             except IntegrityError as e:
                 error_msg = str(e)
                 if 'employee_id' in error_msg:
@@ -36,8 +45,11 @@ def employee_list_create(request):
                 )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@api_view(['DELETE'])
-def employee_delete(request, pk):
+@api_view(['PATCH', 'DELETE'])
+def employee_detail(request, pk):
+    if request.method == 'PATCH':
+        return conditional_update(request, Employee, pk, EmployeeSerializer, 'Employee not found.')
+
     try:
         employee = Employee.objects.get(pk=pk)
         employee.delete()
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import Event
+
+@admin.register(Event)
+class EventAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'created_at']
+    list_filter = ['kind']
+    ordering = ['-id']
@@ -0,0 +1,68 @@
+import threading
+
+from django.conf import settings
+from django.db import router, transaction
+from .models import Event
+
+# Local waiters are woken as soon as this worker publishes; events written by
+# other workers are picked up from the shared log on the next poll.
+_condition = threading.Condition()
+_sequence = 0
+
+# Arbitrary key for the advisory lock that serializes publishers.
+PUBLISH_LOCK_KEY = 0x65766e74
+
+
+def _serialize_publishers(using):
+    """
+    Streams read `id > cursor` and move the cursor to the last id sent. On
+    PostgreSQL ids come from a sequence, so a transaction that drew a lower
+    id can commit after one that drew a higher id, and its event would be
+    skipped. Holding a transaction-scoped lock from drawing the id until
+    commit makes ids visible in order. SQLite serializes writers already.
+    """
+    connection = transaction.get_connection(using)
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [PUBLISH_LOCK_KEY])
+
+
+def publish(kind, payload):
+    global _sequence
+    using = router.db_for_write(Event)
+    with transaction.atomic(using=using):
+        _serialize_publishers(using)
+        event = Event.objects.using(using).create(kind=kind, payload=payload)
+
+    retention = getattr(settings, 'EVENTS_RETENTION', 10000)
+    if event.id % 100 == 0:
+        Event.objects.filter(id__lte=event.id - retention).delete()
+
+    with _condition:
+        _sequence += 1
+        _condition.notify_all()
+    return event
+
+
+def current_sequence():
+    with _condition:
+        return _sequence
+
+
+def wait_for_publish(sequence, timeout):
+    with _condition:
+        if _sequence == sequence:
+            _condition.wait(timeout)
+        return _sequence
+
+
+def latest_event_id():
+    return Event.objects.order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def events_after(cursor, limit=100):
+    return list(
+        Event.objects.filter(id__gt=cursor)
+        .order_by('id')
+        .values_list('id', 'kind', 'payload')[:limit]
+    )
@@ -0,0 +1,13 @@
+from django.db import models
+
+class Event(models.Model):
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'events'
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.id} - {self.kind}"
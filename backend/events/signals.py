@@ -0,0 +1,82 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from attendance.models import Attendance
+from attendance.signals import attendance_batch_saved
+from employees.models import Employee
+from .broadcaster import publish
+
+
+def _daily_counters(date):
+    # Served from the (date, status, employee) index.
+    counts = Attendance.objects.filter(date=date).aggregate(
+        present=Count('id', filter=Q(status='Present')),
+        absent=Count('id', filter=Q(status='Absent')),
+    )
+    return {'date': date, **counts}
+
+
+def _publish_on_commit(kind, payload, delta, counters=dict):
+    # Table totals are never counted here: `delta` carries the change to
+    # total_employees / total_attendance_records for clients to apply.
+    # Daily counters are computed after commit so they include the change.
+    transaction.on_commit(
+        lambda: publish(kind, {**payload, 'delta': delta, 'counters': counters()})
+    )
+
+
+@receiver(post_save, sender=Employee)
+def employee_saved(sender, instance, created, **kwargs):
+    if not created:
+        return
+    _publish_on_commit('employee.created', {
+        'id': instance.pk,
+        'employee_id': instance.employee_id,
+        'full_name': instance.full_name,
+        'department': instance.department.name,
+    }, {'total_employees': 1})
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    _publish_on_commit('employee.deleted', {
+        'id': instance.pk,
+        'employee_id': instance.employee_id,
+    }, {'total_employees': -1})
+
+
+@receiver(post_save, sender=Attendance)
+def attendance_saved(sender, instance, created, **kwargs):
+    date = str(instance.date)
+    _publish_on_commit('attendance.marked', {
+        'id': instance.pk,
+        'employee': instance.employee_id,
+        'date': date,
+        'status': instance.status,
+    }, {'total_attendance_records': int(created)}, lambda: _daily_counters(date))
+
+
+@receiver(post_delete, sender=Attendance)
+def attendance_deleted(sender, instance, origin=None, **kwargs):
+    # Cascades from an employee delete are covered by employee.deleted.
+    if isinstance(origin, Employee):
+        return
+    date = str(instance.date)
+    _publish_on_commit('attendance.deleted', {
+        'id': instance.pk,
+        'employee': instance.employee_id,
+        'date': date,
+    }, {'total_attendance_records': -1}, lambda: _daily_counters(date))
+
+
+@receiver(attendance_batch_saved, sender=Attendance)
+def attendance_batch(sender, instances, created, **kwargs):
+    # One event per affected date rather than one per row.
+    inserted = Counter(str(instance.date) for instance in created)
+    for date in sorted({str(instance.date) for instance in instances}):
+        _publish_on_commit('attendance.batch', {
+            'date': date,
+        }, {'total_attendance_records': inserted[date]}, lambda date=date: _daily_counters(date))
@@ -0,0 +1,79 @@
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from .broadcaster import current_sequence, events_after, latest_event_id, wait_for_publish
+
+
+# Each open stream holds a worker thread for EVENTS_STREAM_TIMEOUT seconds;
+# cap them per process so dashboards cannot take every thread from the API.
+_slots = threading.BoundedSemaphore(getattr(settings, 'EVENTS_MAX_STREAMS', 4))
+
+
+class _SlotStream:
+    """Iterates a stream and gives its slot back once exhausted or closed."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._released = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._stream)
+        except StopIteration:
+            self.close()
+            raise
+
+    def close(self):
+        self._stream.close()
+        if not self._released:
+            self._released = True
+            _slots.release()
+
+
+def _format(event_id, kind, payload):
+    return f"id: {event_id}\nevent: {kind}\ndata: {json.dumps(payload, separators=(',', ':'))}\n\n"
+
+
+def _stream(cursor):
+    poll_interval = getattr(settings, 'EVENTS_POLL_INTERVAL', 1.0)
+    deadline = time.monotonic() + getattr(settings, 'EVENTS_STREAM_TIMEOUT', 30)
+
+    # EventSource reconnects after the stream ends and resumes from Last-Event-ID.
+    yield "retry: 1000\n\n"
+    if cursor is None:
+        cursor = latest_event_id()
+    while time.monotonic() < deadline:
+        sequence = current_sequence()
+        events = events_after(cursor)
+        for event_id, kind, payload in events:
+            cursor = event_id
+            yield _format(event_id, kind, payload)
+        if not events:
+            yield ": keepalive\n\n"
+            wait_for_publish(sequence, poll_interval)
+
+
+@require_GET
+def event_stream(request):
+    if not _slots.acquire(blocking=False):
+        response = JsonResponse({'error': 'Too many open event streams'}, status=503)
+        response['Retry-After'] = str(int(getattr(settings, 'EVENTS_STREAM_TIMEOUT', 30)))
+        return response
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+    try:
+        cursor = int(last_event_id)
+    except (TypeError, ValueError):
+        cursor = None
+
+    response = StreamingHttpResponse(_SlotStream(_stream(cursor)), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
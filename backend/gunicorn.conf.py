@@ -0,0 +1,28 @@
+import gc
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8001')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', '3'))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+timeout = 120
+
+# Import Django once in the master so workers share its pages copy-on-write.
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True') == 'True'
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    # URLconf (views, serializers, DRF) is otherwise imported lazily by each
+    # worker on its first request; resolve it before forking instead.
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+    # Keep the cyclic GC from touching, and so un-sharing, preloaded objects.
+    gc.freeze()
+
+
+def worker_exit(server, worker):
+    # Write audit entries still buffered in this worker before it exits.
+    from audit.buffer import audit_buffer
+    audit_buffer.flush()
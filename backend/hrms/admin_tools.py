@@ -0,0 +1,191 @@
+from datetime import date, datetime, time
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F, Max, Min, Q, QuerySet
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+def estimated_count(queryset):
+    """
+    Row count of the queryset's table from planner statistics (PostgreSQL)
+    or the highest rowid (SQLite), or None when no estimate is available.
+    """
+    connection = connections[queryset.db]
+    table = connection.ops.quote_name(queryset.model._meta.db_table)
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [table])
+        elif connection.vendor == 'sqlite':
+            cursor.execute(f'SELECT MAX(rowid) FROM {table}')
+        else:
+            return None
+        row = cursor.fetchone()
+    # reltuples is -1 for a table that has never been analyzed.
+    return row[0] if row and row[0] is not None and row[0] >= 0 else None
+
+
+class AtLeast(int):
+    """A count that was capped; renders as "10000+" in the changelist."""
+
+    def __str__(self):
+        return f'{int(self)}+'
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Avoids a full COUNT(*) on large tables: an unfiltered changelist uses
+    the table estimate once it passes `estimate_threshold`, and a filtered
+    one counts at most `count_limit` rows, or one page past the page being
+    viewed when that is further, so a capped list always links to the next
+    page. `page_number` is the requested page (see ScalableModelAdmin).
+    """
+    estimate_threshold = 100_000
+    count_limit = 10_000
+
+    def __init__(self, *args, page_number=1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_number = page_number
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list.order_by()
+        if not queryset.query.where:
+            estimate = estimated_count(queryset)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+            return queryset.count()
+        limit = max(self.count_limit, (self.page_number + 1) * self.per_page)
+        count = queryset[:limit + 1].count()
+        return AtLeast(limit) if count > limit else count
+
+
+def _next_period(day, kind):
+    if kind == 'year':
+        return date(day.year + 1, 1, 1)
+    if kind == 'month':
+        return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+    return date.fromordinal(day.toordinal() + 1)
+
+
+class CalendarQuerySet(QuerySet):
+    """
+    Answers dates()/datetimes() for the admin date hierarchy with one indexed
+    EXISTS probe per calendar period between the field's min and max,
+    instead of truncating and de-duplicating every row. The hierarchy's own
+    first=Min(field), last=Max(field) aggregate is answered from the index too.
+    """
+    KINDS = ('year', 'month', 'day')
+
+    def aggregate(self, *args, **kwargs):
+        first, last = kwargs.get('first'), kwargs.get('last')
+        if (
+            not args and len(kwargs) == 2 and type(first) is Min and type(last) is Max
+            and isinstance(first.source_expressions[0], F)
+            and first.source_expressions[0] == last.source_expressions[0]
+        ):
+            first, last = self._bounds(first.source_expressions[0].name)
+            return {'first': first, 'last': last}
+        return super().aggregate(*args, **kwargs)
+
+    def _bounds(self, field_name):
+        # Two ordered lookups rather than one MIN/MAX aggregate: SQLite only
+        # answers a lone MIN or MAX from the index.
+        values = self.order_by().values_list(field_name, flat=True)
+        first = values.order_by(field_name).first()
+        if first is None:
+            return None, None
+        return first, values.order_by(f'-{field_name}').first()
+
+    def dates(self, field_name, kind, order='ASC'):
+        if kind not in self.KINDS:
+            return super().dates(field_name, kind, order)
+        return self._periods(field_name, kind, order, None)
+
+    def datetimes(self, field_name, kind, order='ASC', tzinfo=None):
+        if kind not in self.KINDS:
+            return super().datetimes(field_name, kind, order, tzinfo)
+        if settings.USE_TZ:
+            tzinfo = tzinfo or timezone.get_current_timezone()
+        return self._periods(field_name, kind, order, tzinfo)
+
+    def _periods(self, field_name, kind, order, tzinfo):
+        first, last = self._bounds(field_name)
+        if first is None:
+            return []
+        is_datetime = isinstance(first, datetime)
+        if is_datetime:
+            if tzinfo:
+                first, last = timezone.localtime(first, tzinfo), timezone.localtime(last, tzinfo)
+            first, last = first.date(), last.date()
+
+        def boundary(day):
+            if is_datetime:
+                moment = datetime.combine(day, time.min)
+                return timezone.make_aware(moment, tzinfo) if tzinfo else moment
+            return day
+
+        start = first.replace(month=1, day=1) if kind == 'year' else first.replace(day=1) if kind == 'month' else first
+        periods = []
+        while start <= last:
+            end = _next_period(start, kind)
+            lookup = {f'{field_name}__gte': boundary(start), f'{field_name}__lt': boundary(end)}
+            if self.filter(**lookup).exists():
+                periods.append(boundary(start))
+            start = end
+        return periods if order == 'ASC' else periods[::-1]
+
+
+class ScalableChangeList(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        if self.date_hierarchy and type(queryset) is QuerySet:
+            queryset.__class__ = CalendarQuerySet
+        return queryset
+
+
+class ScalableModelAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    # Skip the second, unfiltered COUNT(*) Django runs for "N of M selected".
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return ScalableChangeList
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        try:
+            page_number = max(int(request.GET.get(PAGE_VAR, 1)), 1)
+        except ValueError:
+            page_number = 1
+        return self.paginator(queryset, per_page, orphans, allow_empty_first_page, page_number=page_number)
+
+
+def matching_employees(term):
+    """
+    Employees matched by exact id or email, or by full name prefix; all
+    indexed. Emails are stored lowercased, so the term is too for that match.
+    """
+    from employees.models import Employee
+
+    return Employee.objects.filter(
+        Q(employee_id=term) | Q(email=term.lower()) | Q(full_name__startswith=term)
+    ).values('pk')
+
+
+class EmployeeSearchMixin:
+    """
+    Resolves the search box to employees first and filters by their ids,
+    instead of LIKE scans joined across every row. `employee_lookup` is the
+    path to the employee from the admin's model ('pk' on Employee itself).
+    """
+    employee_lookup = 'employee'
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        return queryset.filter(**{f'{self.employee_lookup}__in': matching_employees(term)}), False
@@ -0,0 +1,98 @@
+from django.db import router, transaction
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+_updated_at_field = serializers.DateTimeField()
+
+
+def etag_for(updated_at):
+    return f'"{_updated_at_field.to_representation(updated_at)}"'
+
+
+def parse_if_match(request):
+    """
+    Return the updated_at value a client expects from its If-Match header.
+    The raw updated_at string from a response body is accepted as well.
+    """
+    value = request.headers.get('If-Match', '').strip()
+    if value.startswith('W/'):
+        value = value[2:]
+    value = value.strip('"')
+    if not value:
+        return None
+    try:
+        return parse_datetime(value)
+    except ValueError:
+        return None
+
+
+def conditional_update(request, model, pk, serializer_class, not_found_message,
+                       response_serializer_class=None):
+    """
+    PATCH helper: validates the body against a pk-only stub instance and
+    applies it with a single UPDATE ... WHERE id = %s AND updated_at = %s
+    (`If-Match: *` drops the updated_at condition). pre_save is sent with
+    the stub just before the UPDATE; the updated row is then read back into
+    it in the same transaction, while the UPDATE still holds its lock, so
+    post_save receivers get a complete instance. The response serializes it
+    with response_serializer_class (default: serializer_class).
+    Serializers with a resolve_related(validated_data) method create related
+    rows there; that work is rolled back when the UPDATE matches nothing.
+    """
+    if 'If-Match' not in request.headers:
+        return Response(
+            {'error': 'If-Match header is required.'},
+            status=status.HTTP_428_PRECONDITION_REQUIRED
+        )
+    conditions = {'pk': pk}
+    if request.headers['If-Match'].strip() != '*':
+        conditions['updated_at'] = parse_if_match(request)
+        if conditions['updated_at'] is None:
+            return Response(
+                {'error': 'If-Match header must contain an ETag, an updated_at value or *.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    instance = model(pk=pk)
+    serializer = serializer_class(instance, data=request.data, partial=True)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    fields = dict(serializer.validated_data)
+    if not fields:
+        return Response(
+            {'error': 'The request body has no fields that can be updated.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    updated_at = timezone.now()
+    using = router.db_for_write(model)
+    resolve_related = getattr(serializer, 'resolve_related', None)
+    with transaction.atomic(using=using):
+        if resolve_related:
+            fields = resolve_related(fields)
+        update_fields = frozenset(fields) | {'updated_at'}
+        pre_save.send(sender=model, instance=instance, raw=False, using=using, update_fields=update_fields)
+        updated = model.objects.filter(**conditions).update(**fields, updated_at=updated_at)
+        if not updated:
+            transaction.set_rollback(True, using=using)
+        else:
+            instance.refresh_from_db(using=using)
+            post_save.send(
+                sender=model, instance=instance, created=False, raw=False,
+                using=using, update_fields=update_fields,
+            )
+    if not updated:
+        if not model.objects.filter(pk=pk).exists():
+            return Response({'error': not_found_message}, status=status.HTTP_404_NOT_FOUND)
+        return Response(
+            {'error': 'The record was modified by another request.'},
+            status=status.HTTP_412_PRECONDITION_FAILED
+        )
+
+    data = (response_serializer_class or serializer_class)(instance).data
+    response = Response(data, status=status.HTTP_200_OK)
+    response['ETag'] = etag_for(instance.updated_at)
+    return response
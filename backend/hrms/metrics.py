@@ -0,0 +1,19 @@
+import threading
+
+# Per-worker counters reported by /api/metrics/. Any module may add its own.
+_counters = {
+    'coalesced': 0,
+    'computed': 0,
+    'throttled': 0,
+}
+_counters_lock = threading.Lock()
+
+
+def increment(name, amount=1):
+    with _counters_lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def counters_snapshot():
+    with _counters_lock:
+        return dict(_counters)
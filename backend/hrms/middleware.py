@@ -0,0 +1,119 @@
+import gzip
+import logging
+import random
+import re
+import time
+import uuid
+
+from django.conf import settings
+from django.db import connection
+from django.utils.cache import patch_vary_headers
+from .structured_logging import request_id
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+logger = logging.getLogger('hrms.requests')
+
+
+class RequestLoggingMiddleware:
+    """
+    Tags every request with a correlation id (X-Request-ID) and writes one
+    structured access record per request. Successful requests are sampled;
+    errors and slow requests are always logged.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'LOG_SAMPLE_RATE', 1.0)
+        self.slow_request_ms = getattr(settings, 'SLOW_REQUEST_MS', 1000)
+
+    def __call__(self, request):
+        correlation_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+        token = request_id.set(correlation_id)
+        queries = [0]
+
+        def count_queries(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(count_queries):
+                response = self.get_response(request)
+            duration_ms = (time.perf_counter() - start) * 1000
+            response['X-Request-ID'] = correlation_id
+            self.log(request, response.status_code, duration_ms, queries[0])
+            return response
+        finally:
+            request_id.reset(token)
+
+    def log(self, request, status_code, duration_ms, query_count):
+        slow = duration_ms >= self.slow_request_ms
+        if status_code < 400 and not slow and random.random() >= self.sample_rate:
+            return
+
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400 or slow:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+        logger.log(level, '%s %s %s', request.method, request.get_full_path(), status_code, extra={
+            'method': request.method,
+            'path': request.path,
+            'status': status_code,
+            'duration_ms': round(duration_ms, 2),
+            'sql_queries': query_count,
+            'slow': slow,
+        })
+
+
+class CompressionMiddleware:
+    """
+    Compresses non-streaming responses of at least COMPRESSION_MIN_SIZE bytes,
+    preferring brotli when the client accepts it and the package is installed.
+    Streaming responses (the SSE feed, file downloads) pass through untouched.
+    """
+    accepts = {
+        encoding: re.compile(rf'(?:^|,)\s*{encoding}\s*(?:;\s*q=(?!0(?:\.0*)?\s*(?:,|$))[\d.]+)?\s*(?:,|$)')
+        for encoding in ('br', 'gzip')
+    }
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.gzip_level = getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6)
+        self.brotli_quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < self.min_size:
+            return response
+
+        accept_encoding = request.headers.get('Accept-Encoding', '')
+        if brotli is not None and self.accepts['br'].search(accept_encoding):
+            encoding = 'br'
+            content = brotli.compress(response.content, quality=self.brotli_quality)
+        elif self.accepts['gzip'].search(accept_encoding):
+            encoding = 'gzip'
+            content = gzip.compress(response.content, compresslevel=self.gzip_level, mtime=0)
+        else:
+            return response
+
+        if len(content) >= len(response.content):
+            return response
+        response.content = content
+        response['Content-Length'] = str(len(content))
+        response['Content-Encoding'] = encoding
+        # The representation changed, so a strong ETag no longer applies.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
@@ -0,0 +1,158 @@
+import cProfile
+import hmac
+import io
+import json
+import pstats
+import re
+import threading
+import time
+import zipfile
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db import connection
+from .structured_logging import request_id
+
+ARTIFACT_NAME = re.compile(r'^[\w-]+\.zip$')
+
+_write_lock = threading.Lock()
+
+
+def _token_matches(request):
+    token = getattr(settings, 'PROFILING_TOKEN', '')
+    header = request.headers.get('X-Profile-Token', '')
+    return bool(token and header and hmac.compare_digest(header, token))
+
+
+def _is_staff(request):
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_staff)
+
+
+def profiling_allowed(request):
+    """
+    Profiling is opt-in per request: either the X-Profile-Token header matches
+    PROFILING_TOKEN, or a staff user adds ?profile=1.
+    """
+    return _token_matches(request) or bool(request.GET.get('profile') and _is_staff(request))
+
+
+def artifacts_allowed(request):
+    """
+    Listing and downloading bundles needs the token or a staff user, but not
+    ?profile=1, so the X-Profile-Artifact URL works as given.
+    """
+    return _token_matches(request) or _is_staff(request)
+
+
+def artifact_dir():
+    path = getattr(settings, 'PROFILING_DIR', settings.BASE_DIR / 'profiles')
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def list_artifacts():
+    return sorted(artifact_dir().glob('*.zip'), key=lambda path: path.stat().st_mtime, reverse=True)
+
+
+def _explain(sql, params):
+    vendor = connection.vendor
+    is_select = sql.lstrip().upper().startswith(('SELECT', 'WITH'))
+    if vendor == 'sqlite':
+        prefix = 'EXPLAIN QUERY PLAN '
+    elif vendor == 'postgresql':
+        # ANALYZE executes the statement, so only do it for reads.
+        prefix = 'EXPLAIN (ANALYZE, BUFFERS) ' if is_select else 'EXPLAIN '
+    else:
+        prefix = 'EXPLAIN '
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql, params)
+            return [' '.join(str(column) for column in row) for row in cursor.fetchall()]
+    except Exception as exc:
+        return [f'EXPLAIN failed: {exc}']
+
+
+class ProfilingMiddleware:
+    """
+    Runs guarded requests under cProfile, records every SQL query with its
+    EXPLAIN plan and stores the bundle as a zip in a bounded ring buffer.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        # Downloading an artifact should not produce another one.
+        if request.path.startswith('/api/profiles/') or not profiling_allowed(request):
+            return self.get_response(request)
+
+        queries = []
+
+        def record_query(execute, sql, params, many, context):
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                queries.append({
+                    'sql': sql,
+                    'params': None if many else params,
+                    'many': many,
+                    'duration_ms': round((time.perf_counter() - start) * 1000, 3),
+                })
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        with connection.execute_wrapper(record_query):
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        for query in queries:
+            if not query['many']:
+                query['plan'] = _explain(query['sql'], query['params'])
+
+        name = self.store(request, response, duration_ms, profiler, queries)
+        response['X-Profile-Artifact'] = f'/api/profiles/{name}/'
+        return response
+
+    def store(self, request, response, duration_ms, profiler, queries):
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+        # The correlation id may come from the client, so keep it filename-safe.
+        tag = re.sub(r'[^\w-]', '', request_id.get() or '')[:64] or 'request'
+        name = f"{stamp}-{tag}.zip"
+
+        summary = io.StringIO()
+        stats = pstats.Stats(profiler, stream=summary)
+        stats.sort_stats('cumulative').print_stats(50)
+
+        metadata = {
+            'method': request.method,
+            'path': request.get_full_path(),
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 2),
+            'sql_queries': len(queries),
+            'sql_duration_ms': round(sum(query['duration_ms'] for query in queries), 3),
+            'database': connection.vendor,
+        }
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as bundle:
+            bundle.writestr('request.json', json.dumps(metadata, indent=2))
+            bundle.writestr('queries.json', json.dumps(queries, indent=2, default=str))
+            bundle.writestr('profile.txt', summary.getvalue())
+            # Raw pstats data for snakeviz / pstats.Stats(filename).
+            stats_file = artifact_dir() / f'.{name}.prof'
+            profiler.dump_stats(stats_file)
+            bundle.write(stats_file, 'profile.prof')
+            stats_file.unlink()
+
+        limit = getattr(settings, 'PROFILING_MAX_ARTIFACTS', 20)
+        with _write_lock:
+            (artifact_dir() / name).write_bytes(buffer.getvalue())
+            for stale in list_artifacts()[limit:]:
+                stale.unlink(missing_ok=True)
+        return name
@@ -21,11 +21,19 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'corsheaders',
+    'departments',
     'employees',
     'attendance',
+    'events',
+    'sync',
+    'reports',
+    'audit',
+    'analytics',
 ]
 
 MIDDLEWARE = [
+    'hrms.middleware.RequestLoggingMiddleware',
+    'hrms.middleware.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -34,8 +42,29 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'audit.middleware.AuditContextMiddleware',
+    'hrms.profiling.ProfilingMiddleware',
 ]
 
+# API-only profile: the JSON API uses none of the admin, sessions, messages,
+# CSRF or static file machinery, so workers can skip importing it.
+API_ONLY = os.environ.get('API_ONLY', 'False') == 'True'
+
+if API_ONLY:
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in (
+        'django.contrib.admin',
+        'django.contrib.sessions',
+        'django.contrib.messages',
+        'django.contrib.staticfiles',
+    )]
+    MIDDLEWARE = [middleware for middleware in MIDDLEWARE if middleware not in (
+        'django.contrib.sessions.middleware.SessionMiddleware',
+        'django.middleware.csrf.CsrfViewMiddleware',
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+        'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    )]
+
 ROOT_URLCONF = 'hrms.urls'
 
 TEMPLATES = [
@@ -54,6 +83,12 @@ TEMPLATES = [
     },
 ]
 
+if API_ONLY:
+    TEMPLATES[0]['OPTIONS']['context_processors'] = [
+        'django.template.context_processors.debug',
+        'django.template.context_processors.request',
+    ]
+
 WSGI_APPLICATION = 'hrms.wsgi.application'
 
 if os.environ.get('USE_POSTGRESQL', 'False') == 'True':
@@ -102,5 +137,117 @@ REST_FRAMEWORK = {
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
     ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'hrms.throttling.WriteTokenBucketThrottle',
+    ],
     'EXCEPTION_HANDLER': 'hrms.exception_handler.custom_exception_handler',
-}
\ No newline at end of file
+    # Reverse proxies in front of the app (1 on Render). Client addresses
+    # for throttling and auditing trust X-Forwarded-For only this far.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES') or 0),
+}
+
+if API_ONLY:
+    # Session authentication needs the session middleware removed above.
+    REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'] = [
+        'rest_framework.authentication.BasicAuthentication',
+    ]
+
+# Token bucket for POST/DELETE per client: refill rate (tokens/second) and burst size.
+WRITE_THROTTLE_RATE = float(os.environ.get('WRITE_THROTTLE_RATE') or 5)
+WRITE_THROTTLE_BURST = float(os.environ.get('WRITE_THROTTLE_BURST') or 20)
+
+# Server-sent events: how often a stream re-reads the shared event log for
+# changes made by other workers, how long one stream stays open before the
+# client reconnects, and how many events are kept for resuming clients.
+EVENTS_POLL_INTERVAL = float(os.environ.get('EVENTS_POLL_INTERVAL') or 1)
+EVENTS_STREAM_TIMEOUT = float(os.environ.get('EVENTS_STREAM_TIMEOUT') or 30)
+EVENTS_RETENTION = int(os.environ.get('EVENTS_RETENTION') or 10000)
+# Open streams per worker process; keep below GUNICORN_THREADS.
+EVENTS_MAX_STREAMS = int(os.environ.get('EVENTS_MAX_STREAMS') or 4)
+
+# Structured JSON logs, written from a background QueueListener thread.
+# Successful requests are sampled at LOG_SAMPLE_RATE (0-1); errors and
+# requests slower than SLOW_REQUEST_MS are always logged with their SQL count.
+LOG_LEVEL = os.environ.get('LOG_LEVEL') or 'INFO'
+LOG_SAMPLE_RATE = float(os.environ.get('LOG_SAMPLE_RATE') or 1)
+SLOW_REQUEST_MS = float(os.environ.get('SLOW_REQUEST_MS') or 1000)
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'async_json': {
+            'class': 'hrms.structured_logging.AsyncJsonHandler',
+        },
+    },
+    'root': {
+        'handlers': ['async_json'],
+        'level': LOG_LEVEL,
+    },
+    'loggers': {
+        # Drop Django's own console handler so records are not written twice.
+        'django': {
+            'handlers': [],
+            'level': LOG_LEVEL,
+            'propagate': True,
+        },
+        # 4xx responses are already covered by the access log.
+        'django.request': {
+            'level': 'ERROR',
+            'propagate': True,
+        },
+    },
+}
+
+# On-demand profiling: requests carrying X-Profile-Token (or ?profile=1 from a
+# staff user) are run under cProfile with EXPLAIN plans for every query. The
+# newest PROFILING_MAX_ARTIFACTS bundles are kept in PROFILING_DIR.
+PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN', '')
+PROFILING_DIR = Path(os.environ.get('PROFILING_DIR') or BASE_DIR / 'profiles')
+PROFILING_MAX_ARTIFACTS = int(os.environ.get('PROFILING_MAX_ARTIFACTS') or 20)
+
+# Kiosk delta sync: tombstones for deletes are kept this long (older tokens get
+# a full snapshot), each delta re-reads this many seconds before the token to
+# catch late commits, downloads send SYNC_PAGE_SIZE attendance rows per page,
+# and uploads are capped at SYNC_MAX_UPLOAD records.
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.environ.get('SYNC_TOMBSTONE_RETENTION_DAYS') or 30)
+SYNC_OVERLAP_SECONDS = int(os.environ.get('SYNC_OVERLAP_SECONDS') or 5)
+SYNC_PAGE_SIZE = int(os.environ.get('SYNC_PAGE_SIZE') or 5000)
+SYNC_MAX_UPLOAD = int(os.environ.get('SYNC_MAX_UPLOAD') or 1000)
+
+# Response compression: bodies smaller than COMPRESSION_MIN_SIZE bytes are sent
+# as-is. Brotli is used when the optional `brotli` package is installed.
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE') or 1024)
+COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL') or 6)
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY') or 4)
+
+# Badge reader ingest: events per POST, and how far each compaction run
+# re-reads before its checkpoint to pick up events committed late.
+ATTENDANCE_EVENT_BATCH_MAX = int(os.environ.get('ATTENDANCE_EVENT_BATCH_MAX') or 5000)
+COMPACTION_OVERLAP_SECONDS = int(os.environ.get('COMPACTION_OVERLAP_SECONDS') or 60)
+
+# Most employee ids accepted by GET /api/attendance/?employee_ids=...
+ATTENDANCE_BATCH_MAX_EMPLOYEES = int(os.environ.get('ATTENDANCE_BATCH_MAX_EMPLOYEES') or 200)
+
+# Month-end reports: output directory and the process pool size used by
+# `manage.py attendance_report` (defaults to one worker per core).
+REPORTS_DIR = Path(os.environ.get('REPORTS_DIR') or BASE_DIR / 'reports_output')
+REPORT_WORKERS = int(os.environ.get('REPORT_WORKERS') or os.cpu_count() or 1)
+# A running report touches its job every REPORT_HEARTBEAT_SECONDS; pending or
+# running jobs silent for REPORT_STALE_SECONDS are marked failed.
+REPORT_HEARTBEAT_SECONDS = int(os.environ.get('REPORT_HEARTBEAT_SECONDS') or 30)
+REPORT_STALE_SECONDS = int(os.environ.get('REPORT_STALE_SECONDS') or 300)
+
+# Audit trail: entries are buffered per process and written in batches of
+# AUDIT_BATCH_SIZE every AUDIT_FLUSH_INTERVAL seconds. At AUDIT_BUFFER_MAX
+# pending entries the writing request flushes inline.
+AUDIT_FLUSH_INTERVAL = float(os.environ.get('AUDIT_FLUSH_INTERVAL') or 1.0)
+AUDIT_BATCH_SIZE = int(os.environ.get('AUDIT_BATCH_SIZE') or 500)
+AUDIT_BUFFER_MAX = int(os.environ.get('AUDIT_BUFFER_MAX') or 10000)
+
+# Absenteeism analytics: days of history reported, how long results are
+# cached per (department, window), and the |z| at which a department's
+# rolling absence rate is flagged.
+ANALYTICS_HISTORY_DAYS = int(os.environ.get('ANALYTICS_HISTORY_DAYS') or 365)
+ANALYTICS_CACHE_SECONDS = int(os.environ.get('ANALYTICS_CACHE_SECONDS') or 300)
+ANALYTICS_Z_THRESHOLD = float(os.environ.get('ANALYTICS_Z_THRESHOLD') or 2.0)
\ No newline at end of file
@@ -0,0 +1,61 @@
+from django.core.exceptions import FieldDoesNotExist
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that accepts `fields=[...]` and drops every other field,
+    so `?fields=id,full_name` narrows the output.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+def requested_fields(request, serializer_class):
+    """
+    Parse `?fields=` into a list of field names. Returns (fields, error);
+    fields is None when the parameter is absent.
+    """
+    raw = request.query_params.get('fields')
+    if not raw:
+        return None, None
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = sorted(set(fields) - set(serializer_class().fields))
+    if unknown:
+        return None, {'fields': [f"Unknown field(s): {', '.join(unknown)}."]}
+    return fields, None
+
+
+def restrict_queryset(queryset, serializer):
+    """
+    Load only the columns the (possibly narrowed) serializer reads, joining
+    the related tables it follows through dotted sources or relations.
+    """
+    model = queryset.model
+    serializer = getattr(serializer, 'child', serializer)
+    columns, related = set(), set()
+    for field in serializer.fields.values():
+        path = field.source.split('.')
+        if path == ['*']:
+            return queryset
+        try:
+            model_field = model._meta.get_field(path[0])
+        except FieldDoesNotExist:
+            return queryset
+        # A PrimaryKeyRelatedField only needs the foreign key column itself.
+        pk_only = getattr(field, 'use_pk_only_optimization', lambda: False)()
+        if len(path) > 1 or (model_field.is_relation and not pk_only):
+            related.add(path[0])
+        # Relation fields may name the related columns they read.
+        related_columns = getattr(field, 'related_columns', None)
+        if related_columns:
+            columns.update(f'{path[0]}__{column}' for column in related_columns)
+        else:
+            columns.add('__'.join(path))
+    if related:
+        queryset = queryset.select_related(*related)
+    return queryset.only(*columns)
@@ -0,0 +1,95 @@
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+request_id = contextvars.ContextVar('request_id', default=None)
+
+_RESERVED = set(logging.LogRecord('', 0, '', 0, '', None, None).__dict__) | {'message', 'request_id'}
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if getattr(record, 'request_id', None):
+            entry['request_id'] = record.request_id
+        # Anything passed through `extra=` becomes a top-level field.
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class AsyncJsonHandler(QueueHandler):
+    """
+    Enqueues records on the calling thread and formats/writes them as JSON
+    lines from a QueueListener thread. The listener is started per process,
+    so workers forked from a preloaded master get their own.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.addFilter(RequestIdFilter())
+        self._target = logging.StreamHandler(stream or sys.stderr)
+        self._target.setFormatter(JsonFormatter())
+        self._listener = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_listener(self):
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self.queue = queue.SimpleQueue()
+            self._listener = QueueListener(self.queue, self._target)
+            self._listener.start()
+            atexit.register(self._listener.stop)
+            self._pid = os.getpid()
+
+    def prepare(self, record):
+        # Keep extra fields for the JSON formatter; only merge args and
+        # render the traceback, which cannot cross the queue as exc_info.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        self._ensure_listener()
+        super().emit(record)
+
+
+def configure_logging(level=logging.INFO):
+    """Route the root logger through a single AsyncJsonHandler."""
+    handler = AsyncJsonHandler()
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level)
+    return handler
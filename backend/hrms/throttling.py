@@ -0,0 +1,115 @@
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+from .metrics import increment
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.data = None
+        self.status = None
+        self.error = None
+
+
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def single_flight(view):
+    """
+    Share one computation between concurrent identical GET requests in this
+    worker. Followers wait for the leader and receive a copy of its response.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method != 'GET':
+            return view(request, *args, **kwargs)
+
+        key = request.get_full_path()
+        with _in_flight_lock:
+            call = _in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlight()
+                _in_flight[key] = call
+
+        if not leader:
+            increment('coalesced')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return Response(call.data, status=call.status)
+
+        increment('computed')
+        try:
+            response = view(request, *args, **kwargs)
+            call.data = response.data
+            call.status = response.status_code
+            return response
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with _in_flight_lock:
+                _in_flight.pop(key, None)
+            call.done.set()
+
+    return wrapper
+
+
+class WriteTokenBucketThrottle(BaseThrottle):
+    """
+    Per-client token bucket applied to unsafe methods only. Buckets live in
+    process memory, so the limit is enforced per gunicorn worker. Clients
+    are identified by address (X-Forwarded-For is only trusted for
+    NUM_PROXIES hops), and buckets that have refilled are pruned.
+    """
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+    PRUNE_INTERVAL = 60
+
+    _buckets = {}
+    _lock = threading.Lock()
+    _pruned_at = time.monotonic()
+
+    def __init__(self):
+        self.rate = float(getattr(settings, 'WRITE_THROTTLE_RATE', 5))
+        self.burst = float(getattr(settings, 'WRITE_THROTTLE_BURST', 20))
+        self.wait_seconds = None
+
+    def allow_request(self, request, view):
+        if request.method in self.SAFE_METHODS or self.rate <= 0:
+            return True
+
+        ident = self.get_ident(request)
+        now = time.monotonic()
+        with self._lock:
+            if now - WriteTokenBucketThrottle._pruned_at >= self.PRUNE_INTERVAL:
+                self._prune(now)
+            tokens, updated = self._buckets.get(ident, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens >= 1:
+                self._buckets[ident] = (tokens - 1, now)
+                return True
+            self._buckets[ident] = (tokens, now)
+            self.wait_seconds = (1 - tokens) / self.rate
+
+        increment('throttled')
+        return False
+
+    def _prune(self, now):
+        # A full bucket is indistinguishable from a missing one.
+        full = [
+            ident for ident, (tokens, updated) in self._buckets.items()
+            if tokens + (now - updated) * self.rate >= self.burst
+        ]
+        for ident in full:
+            del self._buckets[ident]
+        WriteTokenBucketThrottle._pruned_at = now
+
+    def wait(self):
+        return self.wait_seconds
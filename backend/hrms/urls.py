@@ -1,8 +1,22 @@
-from django.contrib import admin
+from django.conf import settings
 from django.urls import path, include
+from . import views
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/employees/', include('employees.urls')),
     path('api/attendance/', include('attendance.urls')),
-]
\ No newline at end of file
+    path('api/departments/', include('departments.urls')),
+    path('api/events/', include('events.urls')),
+    path('api/sync/', include('sync.urls')),
+    path('api/reports/', include('reports.urls')),
+    path('api/audit/', include('audit.urls')),
+    path('api/analytics/', include('analytics.urls')),
+    path('api/metrics/', views.metrics, name='metrics'),
+    path('api/profiles/', views.profile_list, name='profile-list'),
+    path('api/profiles/<str:name>/', views.profile_download, name='profile-download'),
+]
+
+if 'django.contrib.admin' in settings.INSTALLED_APPS:
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
@@ -0,0 +1,32 @@
+from django.http import FileResponse, Http404, JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from .metrics import counters_snapshot
+from .profiling import ARTIFACT_NAME, artifact_dir, artifacts_allowed, list_artifacts
+
+
+@api_view(['GET'])
+def metrics(request):
+    return Response(counters_snapshot(), status=status.HTTP_200_OK)
+
+
+@require_GET
+def profile_list(request):
+    if not artifacts_allowed(request):
+        raise Http404
+    return JsonResponse([
+        {'name': path.name, 'size': path.stat().st_size, 'url': f'/api/profiles/{path.name}/'}
+        for path in list_artifacts()
+    ], safe=False)
+
+
+@require_GET
+def profile_download(request, name):
+    if not artifacts_allowed(request) or not ARTIFACT_NAME.match(name):
+        raise Http404
+    path = artifact_dir() / name
+    if not path.is_file():
+        raise Http404
+    return FileResponse(path.open('rb'), as_attachment=True, filename=name)
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import ReportJob
+
+@admin.register(ReportJob)
+class ReportJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'month', 'format', 'status', 'shards_done', 'shards_total', 'rows', 'created_at', 'updated_at']
+    list_filter = ['status', 'format']
+    ordering = ['-created_at']
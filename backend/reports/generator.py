@@ -0,0 +1,159 @@
+import csv
+import multiprocessing
+import os
+import shutil
+import tempfile
+from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, FilteredRelation, Q
+from employees.models import Employee
+
+try:
+    import openpyxl
+except ImportError:  # openpyxl is optional; CSV is always available
+    openpyxl = None
+
+HEADER = ['employee_id', 'full_name', 'department', 'present', 'absent', 'marked', 'attendance_rate']
+FORMATS = ('csv', 'xlsx')
+
+
+def parse_month(value):
+    """Return the first and last day of a 'YYYY-MM' month."""
+    try:
+        year, month = (int(part) for part in value.split('-'))
+        first = date(year, month, 1)
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError("Month must be in YYYY-MM format.")
+    return first, first.replace(day=monthrange(year, month)[1])
+
+
+def reports_dir():
+    path = Path(settings.REPORTS_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def shard_bounds(shards):
+    """Split employees into at most `shards` contiguous, equally sized id ranges."""
+    ids = list(Employee.objects.order_by('id').values_list('id', flat=True))
+    if not ids:
+        return []
+    step = -(-len(ids) // max(shards, 1))
+    return [(ids[offset], ids[min(offset + step, len(ids)) - 1]) for offset in range(0, len(ids), step)]
+
+
+def report_shard(low, high, first, last, path):
+    """
+    Summarize one id range with a single grouped query and stream the rows
+    to a CSV part file. Returns the number of rows written.
+    """
+    summaries = (
+        Employee.objects
+        .filter(id__range=(low, high))
+        .annotate(month=FilteredRelation(
+            'attendance_records',
+            condition=Q(attendance_records__date__range=(first, last)),
+        ))
+        .values_list('employee_id', 'full_name', 'department__name')
+        .annotate(
+            present=Count('month', filter=Q(month__status='Present')),
+            absent=Count('month', filter=Q(month__status='Absent')),
+        )
+        .order_by('id')
+    )
+    written = 0
+    with open(path, 'w', newline='') as part:
+        writer = csv.writer(part)
+        for employee_id, full_name, department, present, absent in summaries.iterator(chunk_size=2000):
+            marked = present + absent
+            rate = round(present / marked * 100, 1) if marked else ''
+            writer.writerow([employee_id, full_name, department, present, absent, marked, rate])
+            written += 1
+    return written
+
+
+def _pool_context():
+    # Forked workers start instantly and inherit the configured settings;
+    # fall back to the platform default where fork is unavailable.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def _merge_csv(parts, output):
+    with open(output, 'w', newline='') as merged:
+        csv.writer(merged).writerow(HEADER)
+        for part in parts:
+            with open(part, newline='') as source:
+                shutil.copyfileobj(source, merged)
+
+
+def _merge_xlsx(parts, output):
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Attendance')
+    sheet.append(HEADER)
+    for part in parts:
+        with open(part, newline='') as source:
+            for row in csv.reader(source):
+                sheet.append(row[:3] + [int(value) for value in row[3:6]] + [float(row[6]) if row[6] else None])
+    workbook.save(output)
+
+
+def generate_report(month, format='csv', output=None, workers=None, shards=None, progress=None, started=None):
+    """
+    Write the per-employee attendance summary for `month` and return
+    (path, rows). Employees are split into id-range shards that a process
+    pool summarizes in parallel; the part files are concatenated in id
+    order. `progress(done, total)` is called as shards finish, and
+    `started()` once the pool's workers exist, after which nothing is
+    forked, so callers can start threads there.
+    """
+    first, last = parse_month(month)
+    if format not in FORMATS:
+        raise ValueError(f"Format must be one of: {', '.join(FORMATS)}.")
+    if format == 'xlsx' and openpyxl is None:
+        raise ValueError("XLSX reports require the openpyxl package.")
+
+    workers = workers or settings.REPORT_WORKERS
+    output = Path(output or reports_dir() / f'attendance-{month}.{format}')
+    # Several shards per worker keep every process busy until the end.
+    bounds = shard_bounds(shards or workers * 4)
+    if progress:
+        progress(0, len(bounds))
+
+    scratch = Path(tempfile.mkdtemp(prefix='attendance-report-', dir=output.parent))
+    try:
+        parts = [scratch / f'{index:05d}.csv' for index in range(len(bounds))]
+        tasks = [(low, high, first, last, str(part)) for (low, high), part in zip(bounds, parts)]
+        rows = 0
+        if workers == 1 or len(tasks) <= 1:
+            if started:
+                started()
+            for done, task in enumerate(tasks, start=1):
+                rows += report_shard(*task)
+                if progress:
+                    progress(done, len(tasks))
+        else:
+            # Children must open their own connections, not share the parent's.
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+                # A fork pool starts all of its workers on the first submit.
+                futures = [pool.submit(report_shard, *task) for task in tasks]
+                if started:
+                    started()
+                for done, future in enumerate(as_completed(futures), start=1):
+                    rows += future.result()
+                    if progress:
+                        progress(done, len(tasks))
+
+        pending = scratch / output.name
+        (_merge_xlsx if format == 'xlsx' else _merge_csv)(parts, pending)
+        os.replace(pending, output)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return output, rows
@@ -0,0 +1,64 @@
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from reports.generator import FORMATS, generate_report
+from reports.models import ReportJob
+
+
+class Command(BaseCommand):
+    help = 'Write the per-employee attendance summary for a month, sharded across a process pool.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--month', required=True, help='Month to report, as YYYY-MM.')
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--output', help='Destination file (default: REPORTS_DIR/attendance-<month>.<format>).')
+        parser.add_argument('--workers', type=int, help='Worker processes (default: REPORT_WORKERS).')
+        parser.add_argument('--job', type=int, help='ReportJob id to record progress on.')
+
+    def handle(self, *args, **options):
+        jobs = ReportJob.objects.filter(pk=options['job']) if options['job'] else ReportJob.objects.none()
+        jobs.update(status='running', updated_at=timezone.now())
+
+        def progress(done, total):
+            jobs.update(shards_done=done, shards_total=total, updated_at=timezone.now())
+            if options['verbosity'] >= 1:
+                self.stdout.write(f'{done}/{total} shards')
+
+        stop = threading.Event()
+
+        def started():
+            # Only once the pool has forked, so no child starts mid-beat.
+            if options['job']:
+                threading.Thread(target=self.heartbeat, args=(jobs, stop), daemon=True).start()
+
+        try:
+            path, rows = generate_report(
+                options['month'],
+                format=options['format'],
+                output=options['output'],
+                workers=options['workers'],
+                progress=progress,
+                started=started,
+            )
+        except Exception as exc:
+            now = timezone.now()
+            jobs.update(status='failed', error=str(exc), finished_at=now, updated_at=now)
+            if isinstance(exc, ValueError):
+                raise CommandError(exc)
+            raise
+        finally:
+            stop.set()
+
+        now = timezone.now()
+        jobs.update(status='done', rows=rows, file=path.name, finished_at=now, updated_at=now)
+        self.stdout.write(self.style.SUCCESS(f'Wrote {rows} employee(s) to {path}.'))
+
+    def heartbeat(self, jobs, stop):
+        # Keeps a job with long shards from looking stale; the thread's
+        # connection is closed after each beat rather than left idle.
+        while not stop.wait(settings.REPORT_HEARTBEAT_SECONDS):
+            jobs.filter(status='running').update(updated_at=timezone.now())
+            connection.close()
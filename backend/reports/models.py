@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+class ReportJobManager(models.Manager):
+    def expire_stale(self):
+        """
+        Fail pending or running jobs whose process has not written a
+        heartbeat for REPORT_STALE_SECONDS, so they stop blocking their month.
+        """
+        now = timezone.now()
+        return self.filter(
+            status__in=['pending', 'running'],
+            updated_at__lt=now - timedelta(seconds=settings.REPORT_STALE_SECONDS),
+        ).update(status='failed', error='The report process stopped responding.', finished_at=now, updated_at=now)
+
+class ReportJob(models.Model):
+    """
+    A month-end report requested through the API. The generator runs in a
+    separate `attendance_report` process and records its progress here,
+    touching updated_at every REPORT_HEARTBEAT_SECONDS while it runs.
+    """
+    FORMAT_CHOICES = [
+        ('csv', 'CSV'),
+        ('xlsx', 'Excel'),
+    ]
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    month = models.CharField(max_length=7)
+    format = models.CharField(max_length=4, choices=FORMAT_CHOICES, default='csv')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    shards_done = models.PositiveIntegerField(default=0)
+    shards_total = models.PositiveIntegerField(default=0)
+    rows = models.PositiveIntegerField(default=0)
+    file = models.CharField(max_length=255, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ReportJobManager()
+
+    class Meta:
+        db_table = 'report_jobs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['month', 'format', 'status']),
+        ]
+
+    def __str__(self):
+        return f"Attendance report {self.month} ({self.format}) - {self.status}"
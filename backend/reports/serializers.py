@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from .generator import parse_month
+from .models import ReportJob
+
+class ReportRequestSerializer(serializers.Serializer):
+    month = serializers.CharField()
+    format = serializers.ChoiceField(choices=ReportJob.FORMAT_CHOICES, default='csv')
+
+    def validate_month(self, value):
+        try:
+            parse_month(value)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc))
+        return value
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportJob
+        fields = ['id', 'month', 'format', 'status', 'shards_done', 'shards_total', 'rows', 'error',
+                  'created_at', 'updated_at', 'finished_at', 'download_url']
+
+    def get_download_url(self, obj):
+        return f'/api/reports/attendance/{obj.pk}/download/' if obj.status == 'done' else None
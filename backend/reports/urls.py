@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('attendance/', views.attendance_report, name='attendance-report'),
+    path('attendance/<int:pk>/', views.attendance_report_status, name='attendance-report-status'),
+    path('attendance/<int:pk>/download/', views.attendance_report_download, name='attendance-report-download'),
+]
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+from django.conf import settings
+from django.http import FileResponse, Http404
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from .generator import openpyxl, reports_dir
+from .models import ReportJob
+from .serializers import ReportJobSerializer, ReportRequestSerializer
+
+
+def start_job(job):
+    # Run in a separate process so the pool is not forked from a threaded
+    # web worker and the report survives the request.
+    subprocess.Popen(
+        [sys.executable, str(settings.BASE_DIR / 'manage.py'), 'attendance_report',
+         '--month', job.month, '--format', job.format, '--job', str(job.pk), '--verbosity', '0'],
+        cwd=settings.BASE_DIR,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+@api_view(['POST'])
+def attendance_report(request):
+    serializer = ReportRequestSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    month, report_format = serializer.validated_data['month'], serializer.validated_data['format']
+    if report_format == 'xlsx' and openpyxl is None:
+        return Response(
+            {'error': 'XLSX reports require the openpyxl package.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    # Repeated clicks join the report already being generated, unless its
+    # process has died.
+    ReportJob.objects.expire_stale()
+    job = ReportJob.objects.filter(month=month, format=report_format, status__in=['pending', 'running']).first()
+    if job:
+        return Response(ReportJobSerializer(job).data, status=status.HTTP_200_OK)
+
+    job = ReportJob.objects.create(month=month, format=report_format)
+    try:
+        start_job(job)
+    except OSError as exc:
+        job.status, job.error, job.finished_at = 'failed', f'Could not start the report process: {exc}', timezone.now()
+        job.save(update_fields=['status', 'error', 'finished_at', 'updated_at'])
+        return Response(ReportJobSerializer(job).data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return Response(
+        ReportJobSerializer(job).data,
+        status=status.HTTP_202_ACCEPTED,
+        headers={'Location': f'/api/reports/attendance/{job.pk}/'},
+    )
+
+
+@api_view(['GET'])
+def attendance_report_status(request, pk):
+    ReportJob.objects.expire_stale()
+    try:
+        job = ReportJob.objects.get(pk=pk)
+    except ReportJob.DoesNotExist:
+        return Response(
+            {'error': 'Report not found.'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(ReportJobSerializer(job).data, status=status.HTTP_200_OK)
+
+
+@require_GET
+def attendance_report_download(request, pk):
+    job = ReportJob.objects.filter(pk=pk, status='done').first()
+    if job is None:
+        raise Http404
+    path = reports_dir() / job.file
+    if not path.is_file():
+        raise Http404
+    return FileResponse(path.open('rb'), as_attachment=True, filename=job.file)
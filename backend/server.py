@@ -1,14 +1,17 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DESCENDING
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List
+from typing import List, Optional
 import uuid
 from datetime import datetime, timezone
+from hrms.structured_logging import configure_logging
 
 
 ROOT_DIR = Path(__file__).parent
@@ -16,9 +19,18 @@ load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# tz_aware so BSON dates come back as UTC-aware datetimes
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[os.environ['DB_NAME']]
 
+MAX_PAGE_SIZE = 1000
+MAX_BULK_SIZE = 1000
+
+
+def get_db():
+    # Dependency so tests can swap in mongomock-motor or a local mongod
+    return db
+
 # Create the main app without a prefix
 app = FastAPI()
 
@@ -26,13 +38,19 @@ app = FastAPI()
 api_router = APIRouter(prefix="/api")
 
 
+def utc_now():
+    # BSON dates hold milliseconds; truncate so the timestamp a client gets
+    # back matches the stored one when passed as `until`
+    now = datetime.now(timezone.utc)
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
 # Define Models
 class StatusCheck(BaseModel):
     model_config = ConfigDict(extra="ignore")  # Ignore MongoDB's _id field
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     client_name: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=utc_now)
 
 class StatusCheckCreate(BaseModel):
     client_name: str
@@ -43,28 +61,61 @@ async def root():
     return {"message": "Hello World"}
 
 @api_router.post("/status", response_model=StatusCheck)
-async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.model_dump()
-    status_obj = StatusCheck(**status_dict)
-    
-    # Convert to dict and serialize datetime to ISO string for MongoDB
-    doc = status_obj.model_dump()
-    doc['timestamp'] = doc['timestamp'].isoformat()
-    
-    _ = await db.status_checks.insert_one(doc)
+async def create_status_check(input: StatusCheckCreate, database=Depends(get_db)):
+    status_obj = StatusCheck(**input.model_dump())
+
+    # timestamp stays a datetime, which Motor stores as a native BSON date
+    await database.status_checks.insert_one(status_obj.model_dump())
     return status_obj
 
+@api_router.post("/status/bulk", response_model=List[StatusCheck])
+async def create_status_checks_bulk(inputs: List[StatusCheckCreate], database=Depends(get_db)):
+    if len(inputs) > MAX_BULK_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BULK_SIZE} status checks per request.")
+    if not inputs:
+        return []
+
+    status_objs = [StatusCheck(**item.model_dump()) for item in inputs]
+    await database.status_checks.insert_many([obj.model_dump() for obj in status_objs], ordered=False)
+    return status_objs
+
 @api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    # Exclude MongoDB's _id field from the query results
-    status_checks = await db.status_checks.find({}, {"_id": 0}).to_list(1000)
-    
-    # Convert ISO string timestamps back to datetime objects
-    for check in status_checks:
-        if isinstance(check['timestamp'], str):
-            check['timestamp'] = datetime.fromisoformat(check['timestamp'])
-    
-    return status_checks
+async def get_status_checks(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    until_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    database=Depends(get_db),
+):
+    """
+    Newest first. To fetch the next page pass the last item's timestamp as
+    `until` and its id as `until_id`.
+    """
+    query = {}
+    if since is not None:
+        query["timestamp"] = {"$gte": since}
+    if until is not None:
+        older = {"timestamp": {"$lt": until}}
+        if until_id is not None:
+            older = {"$or": [older, {"timestamp": until, "id": {"$lt": until_id}}]}
+        query = {"$and": [query, older]} if query else older
+
+    # Exclude MongoDB's _id field and stream documents from the cursor
+    cursor = (
+        database.status_checks.find(query, {"_id": 0})
+        .sort([("timestamp", DESCENDING), ("id", DESCENDING)])
+        .limit(limit)
+    )
+
+    async def stream():
+        yield "["
+        first = True
+        async for doc in cursor:
+            yield ("" if first else ",") + StatusCheck.model_validate(doc).model_dump_json()
+            first = False
+        yield "]"
+
+    return StreamingResponse(stream(), media_type="application/json")
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -77,13 +128,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: JSON lines written from a background listener thread
+configure_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def prepare_status_checks():
+    # Documents written with ISO string timestamps are converted once by
+    # convert_status_timestamps.py, not on every start
+    database = app.dependency_overrides.get(get_db, get_db)()
+    await database.status_checks.create_index([("timestamp", DESCENDING), ("id", DESCENDING)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
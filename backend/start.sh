@@ -5,9 +5,5 @@ echo "Starting Django application..."
 
 cd /app/backend
 
-python manage.py makemigrations --noinput
-python manage.py migrate --noinput
-
-python manage.py collectstatic --noinput --clear
-
-gunicorn hrms.wsgi:application --bind 0.0.0.0:8001 --workers 3 --timeout 120
+# Migrations and collectstatic run once in build.sh, not on every container start.
+exec gunicorn hrms.wsgi:application -c gunicorn.conf.py
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entity",
+                    models.CharField(
+                        choices=[
+                            ("employee", "Employee"),
+                            ("attendance", "Attendance"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "tombstones",
+                "ordering": ["deleted_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["deleted_at"], name="tombstones_deleted_e1ba76_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import models
+
+class Tombstone(models.Model):
+    ENTITY_CHOICES = [
+        ('employee', 'Employee'),
+        ('attendance', 'Attendance'),
+    ]
+
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'tombstones'
+        ordering = ['deleted_at']
+        indexes = [
+            models.Index(fields=['deleted_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.entity} {self.object_id} deleted at {self.deleted_at}"
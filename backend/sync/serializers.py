@@ -0,0 +1,7 @@
+from rest_framework import serializers
+from attendance.models import Attendance
+
+class AttendanceUploadSerializer(serializers.Serializer):
+    employee = serializers.IntegerField()
+    date = serializers.DateField()
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES)
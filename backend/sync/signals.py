@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from attendance.models import Attendance
+from employees.models import Employee
+from .models import Tombstone
+
+
+def _record(entity, object_id):
+    Tombstone.objects.create(entity=entity, object_id=object_id)
+    # Tokens older than the retention get a full snapshot instead of a delta.
+    cutoff = timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    _record('employee', instance.pk)
+
+
+@receiver(post_delete, sender=Attendance)
+def attendance_deleted(sender, instance, origin=None, **kwargs):
+    # Kiosks drop an employee's attendance along with the employee tombstone.
+    if isinstance(origin, Employee):
+        return
+    _record('attendance', instance.pk)
@@ -0,0 +1,182 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from attendance.models import Attendance
+from attendance.signals import send_batch_saved
+from employees.models import Employee
+from .models import Tombstone
+from .serializers import AttendanceUploadSerializer
+
+EMPLOYEE_FIELDS = ['id', 'employee_id', 'full_name', 'email', 'department__name', 'updated_at']
+ATTENDANCE_FIELDS = ['id', 'employee', 'date', 'status', 'updated_at']
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def make_token(moment):
+    # Integer arithmetic: cursors must round-trip updated_at exactly.
+    return str((moment - EPOCH) // MICROSECOND)
+
+
+def parse_token(token):
+    try:
+        return EPOCH + int(token) * MICROSECOND
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def make_cursor(issued, cutoff, updated_at, pk):
+    """Continuation of a paged download: when it started, its delta cutoff (0 for full) and the last row sent."""
+    return '.'.join([make_token(issued), make_token(cutoff or EPOCH), make_token(updated_at), str(pk)])
+
+
+def parse_cursor(cursor):
+    try:
+        issued, cutoff, updated_at, pk = cursor.split('.')
+        pk = int(pk)
+    except ValueError:
+        return None
+    issued, cutoff, updated_at = parse_token(issued), parse_token(cutoff), parse_token(updated_at)
+    if None in (issued, cutoff, updated_at):
+        return None
+    return issued, None if cutoff == EPOCH else cutoff, updated_at, pk
+
+
+def _rename_department(row):
+    row['department'] = row.pop('department__name')
+    return row
+
+
+@api_view(['GET', 'POST'])
+def sync(request):
+    if request.method == 'POST':
+        return upload(request)
+    if request.query_params.get('cursor'):
+        return download_page(request)
+
+    now = timezone.now()
+    since = None
+    if request.query_params.get('since'):
+        since = parse_token(request.query_params['since'])
+        if since is None:
+            return Response(
+                {'error': 'Invalid sync token.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    # Tokens older than the tombstone retention cannot be served as a delta.
+    retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    full = since is None or since < now - retention
+
+    employees = Employee.objects.order_by().values(*EMPLOYEE_FIELDS)
+    deleted = {'employees': [], 'attendance': []}
+    cutoff = None
+
+    if not full:
+        # Overlap the window so rows committed late with an older updated_at
+        # are not missed; kiosks upsert by id, so repeats are harmless.
+        cutoff = since - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
+        employees = employees.filter(updated_at__gte=cutoff)
+        tombstones = Tombstone.objects.filter(deleted_at__gte=cutoff).values_list('entity', 'object_id')
+        for entity, object_id in tombstones:
+            deleted['employees' if entity == 'employee' else 'attendance'].append(object_id)
+
+    return Response({
+        'full': full,
+        'employees': [_rename_department(row) for row in employees],
+        **_attendance_page(now, cutoff),
+        'deleted': deleted,
+    }, status=status.HTTP_200_OK)
+
+
+def download_page(request):
+    parsed = parse_cursor(request.query_params['cursor'])
+    if parsed is None:
+        return Response(
+            {'error': 'Invalid sync cursor.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    issued, cutoff, updated_at, pk = parsed
+    return Response({
+        'full': cutoff is None,
+        'employees': [],
+        **_attendance_page(issued, cutoff, (updated_at, pk)),
+        'deleted': {'employees': [], 'attendance': []},
+    }, status=status.HTTP_200_OK)
+
+
+def _attendance_page(issued, cutoff, after=None):
+    """
+    One SYNC_PAGE_SIZE page of attendance in (updated_at, id) order. Rows
+    changed while a client pages move past its position and are still
+    sent; the sync token is only issued with the last page.
+    """
+    attendance = Attendance.objects.order_by('updated_at', 'id').values(*ATTENDANCE_FIELDS)
+    if cutoff is not None:
+        attendance = attendance.filter(updated_at__gte=cutoff)
+    if after is not None:
+        updated_at, pk = after
+        attendance = attendance.filter(Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=pk))
+
+    page_size = settings.SYNC_PAGE_SIZE
+    rows = list(attendance[:page_size + 1])
+    if len(rows) <= page_size:
+        return {'token': make_token(issued), 'next': None, 'attendance': rows}
+    rows = rows[:page_size]
+    last = rows[-1]
+    return {'token': None, 'next': make_cursor(issued, cutoff, last['updated_at'], last['id']), 'attendance': rows}
+
+
+def upload(request):
+    records = request.data.get('attendance') if isinstance(request.data, dict) else None
+    if not isinstance(records, list):
+        return Response(
+            {'error': "Expected {'attendance': [...]}."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(records) > settings.SYNC_MAX_UPLOAD:
+        return Response(
+            {'error': f'At most {settings.SYNC_MAX_UPLOAD} attendance records per upload.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    serializer = AttendanceUploadSerializer(data=records, many=True)
+    if not serializer.is_valid():
+        return Response({'attendance': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Last write wins for repeated (employee, date) pairs within one batch.
+    latest = {}
+    for record in serializer.validated_data:
+        latest[(record['employee'], record['date'])] = record['status']
+
+    employee_ids = {employee for employee, _ in latest}
+    existing = set(Employee.objects.filter(id__in=employee_ids).values_list('id', flat=True))
+    missing = sorted(employee_ids - existing)
+    if missing:
+        return Response(
+            {'error': 'Employees do not exist.', 'employees': missing},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    instances = [
+        Attendance(employee_id=employee, date=date, status=record_status)
+        for (employee, date), record_status in latest.items()
+    ]
+    with transaction.atomic():
+        Attendance.objects.bulk_create(
+            instances,
+            update_conflicts=True,
+            unique_fields=['employee', 'date'],
+            update_fields=['status', 'updated_at'],
+        )
+        send_batch_saved(instances, ['status', 'updated_at'])
+
+    return Response({'saved': len(instances)}, status=status.HTTP_200_OK)
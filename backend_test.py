@@ -7,9 +7,17 @@ Tests all Django REST Framework endpoints for Employee and Attendance management
 import requests
 import sys
 import json
-from datetime import datetime, date
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timedelta
+from pathlib import Path
 from typing import Dict, Any, List, Tuple
 
+BACKEND_DIR = Path(__file__).resolve().parent / "backend"
+
 class HRMSAPITester:
     def __init__(self, base_url: str = "https://localhost:5432"):
         self.base_url = base_url
@@ -38,16 +46,19 @@ class HRMSAPITester:
             print(f"    Details: {details}")
         print()
 
-    def make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Tuple[bool, Dict, int]:
+    def make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None,
+                     extra_headers: Dict = None) -> Tuple[bool, Dict, int]:
         """Make HTTP request and return success, response data, status code"""
         url = f"{self.base_url}/api/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
+        headers = {'Content-Type': 'application/json', **(extra_headers or {})}
         
         try:
             if method == 'GET':
                 response = requests.get(url, headers=headers, params=params, timeout=30)
             elif method == 'POST':
                 response = requests.post(url, json=data, headers=headers, timeout=30)
+            elif method == 'PATCH':
+                response = requests.patch(url, json=data, headers=headers, timeout=30)
             elif method == 'DELETE':
                 response = requests.delete(url, headers=headers, timeout=30)
             else:
@@ -321,6 +332,262 @@ class HRMSAPITester:
             self.log_test("Dashboard Stats (Date Filter)", False, f"Status: {status}, Error: {data}")
             return False
 
+    def test_employee_patch_if_match(self):
+        """Test PATCH /api/employees/<id>/ requires a current If-Match"""
+        success, employee_data = self.test_employee_create_valid()
+        if not success:
+            self.log_test("Employee Patch (Setup)", False, "Failed to create employee for patch test")
+            return False
+
+        endpoint = f"employees/{employee_data.get('id')}/"
+        _, _, missing_status = self.make_request('PATCH', endpoint, {"full_name": "Patched Test"})
+        success, data, status = self.make_request(
+            'PATCH', endpoint, {"full_name": "Patched Test"},
+            extra_headers={'If-Match': employee_data.get('updated_at')}
+        )
+        _, _, stale_status = self.make_request(
+            'PATCH', endpoint, {"full_name": "Stale Test"},
+            extra_headers={'If-Match': employee_data.get('updated_at')}
+        )
+        _, any_data, any_status = self.make_request(
+            'PATCH', endpoint, {"full_name": "Any Test"}, extra_headers={'If-Match': '*'}
+        )
+        _, _, empty_status = self.make_request(
+            'PATCH', endpoint, {"id": 0}, extra_headers={'If-Match': '*'}
+        )
+
+        if missing_status == 428 and success and status == 200 and stale_status == 412 \
+                and data.get('email') == employee_data.get('email') and data.get('full_name') == "Patched Test" \
+                and any_status == 200 and any_data.get('full_name') == "Any Test" and empty_status == 400:
+            self.log_test("Employee Patch (If-Match)", True,
+                          "428 without If-Match, 200 with the full record when current, 412 when stale, "
+                          "200 for *, 400 with nothing to update")
+            return True
+        else:
+            self.log_test("Employee Patch (If-Match)", False,
+                          f"Statuses: missing={missing_status}, current={status}, stale={stale_status}, "
+                          f"any={any_status}, empty={empty_status}; body: {data}")
+            return False
+
+    def test_attendance_patch_if_match(self):
+        """Test PATCH /api/attendance/records/<id>/ rejects a stale If-Match"""
+        success, attendance_data = self.test_attendance_create_valid()
+        if not success:
+            self.log_test("Attendance Patch (Setup)", False, "Failed to create attendance for patch test")
+            return False
+
+        endpoint = f"attendance/records/{attendance_data.get('id')}/"
+        success, data, status = self.make_request(
+            'PATCH', endpoint, {"status": "Absent"},
+            extra_headers={'If-Match': attendance_data.get('updated_at')}
+        )
+        _, _, stale_status = self.make_request(
+            'PATCH', endpoint, {"status": "Present"},
+            extra_headers={'If-Match': attendance_data.get('updated_at')}
+        )
+
+        if success and data.get('status') == 'Absent' and data.get('date') == attendance_data.get('date') \
+                and stale_status == 412:
+            self.log_test("Attendance Patch (If-Match)", True, "200 with the full record when current, 412 when stale")
+            return True
+        else:
+            self.log_test("Attendance Patch (If-Match)", False, f"Statuses: current={status}, stale={stale_status}")
+            return False
+
+    def test_rejected_patch_creates_no_department(self):
+        """Test a PATCH rejected with 412 does not leave its new department behind"""
+        success, employee_data = self.test_employee_create_valid()
+        if not success:
+            self.log_test("Rejected Patch Department (Setup)", False, "Failed to create employee for patch test")
+            return False
+
+        endpoint = f"employees/{employee_data.get('id')}/"
+        self.make_request('PATCH', endpoint, {"full_name": "Patched Test"},
+                          extra_headers={'If-Match': employee_data.get('updated_at')})
+        department = f"Stale Dept {datetime.now().strftime('%H%M%S%f')}"
+        _, _, stale_status = self.make_request(
+            'PATCH', endpoint, {"department": department},
+            extra_headers={'If-Match': employee_data.get('updated_at')}
+        )
+        _, departments, _ = self.make_request('GET', 'departments/')
+        leaked = any(row.get('name') == department for row in departments.get('departments', []))
+
+        if stale_status == 412 and not leaked:
+            self.log_test("Rejected Patch Department", True, "412, and the department was not created")
+            return True
+        else:
+            self.log_test("Rejected Patch Department", False,
+                          f"Stale status: {stale_status}, department created by stale request: {leaked}")
+            return False
+
+    def test_department_move_headcount(self):
+        """Test moving an employee moves one from the old department's headcount to the new one's"""
+        suffix = datetime.now().strftime('%H%M%S%f')
+        source, target = f"Move From {suffix}", f"Move To {suffix}"
+        success, employee_data, status = self.make_request('POST', 'employees/', {
+            "employee_id": f"EMP{suffix}M",
+            "full_name": "Move Test",
+            "email": f"move.test.{suffix}@company.com",
+            "department": source
+        })
+        if not success:
+            self.log_test("Department Move (Setup)", False, f"Status: {status}, Error: {employee_data}")
+            return False
+        self.created_employees.append(employee_data.get('id'))
+
+        self.make_request('PATCH', f"employees/{employee_data.get('id')}/", {"department": target},
+                          extra_headers={'If-Match': employee_data.get('updated_at')})
+        _, departments, _ = self.make_request('GET', 'departments/')
+        headcount = {row.get('name'): row.get('headcount') for row in departments.get('departments', [])}
+
+        if headcount.get(source) == 0 and headcount.get(target) == 1:
+            self.log_test("Department Move (Headcount)", True, "Old department 0, new department 1")
+            return True
+        else:
+            self.log_test("Department Move (Headcount)", False,
+                          f"Old: {headcount.get(source)}, new: {headcount.get(target)}")
+            return False
+
+    def test_bulk_mark_counts_inserted_rows(self):
+        """Test POST /api/attendance/unmarked/ only counts the rows it inserted"""
+        department = f"Bulk Test {datetime.now().strftime('%H%M%S%f')}"
+        ids = []
+        for index in range(2):
+            timestamp = datetime.now().strftime('%Y%m%d%H%M%S%f')
+            success, data, status = self.make_request('POST', 'employees/', {
+                "employee_id": f"EMP{timestamp}{index}",
+                "full_name": f"Bulk Test {timestamp}",
+                "email": f"bulk.test.{timestamp}{index}@company.com",
+                "department": department
+            })
+            if not success:
+                self.log_test("Bulk Mark (Setup)", False, f"Status: {status}, Error: {data}")
+                return False
+            self.created_employees.append(data.get('id'))
+            ids.append(data.get('id'))
+
+        day = (date.today() - timedelta(days=400)).isoformat()
+        body = {"date": day, "department": department, "status": "Absent"}
+        _, first, _ = self.make_request('POST', 'attendance/unmarked/', body)
+        _, second, _ = self.make_request('POST', 'attendance/unmarked/', body)
+
+        if first.get('marked') == 2 and second.get('marked') == 0:
+            self.log_test("Bulk Mark (Inserted Rows)", True, "Marked 2, then 0 on repeat")
+            return True, ids, day
+        else:
+            self.log_test("Bulk Mark (Inserted Rows)", False, f"First: {first}, repeat: {second}")
+            return False, ids, day
+
+    def wait_for_audit(self, params: Dict, timeout: float = 10) -> List[Dict]:
+        """Poll the audit log until entries matching params appear (they are written in the background)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            success, data, _ = self.make_request('GET', 'audit/', params=params)
+            results = data.get('results', []) if success else []
+            if results or time.monotonic() > deadline:
+                return results
+            time.sleep(0.5)
+
+    def test_audit_trail(self):
+        """Test updates and bulk writes reach the audit log with their row ids"""
+        success, employee_data = self.test_employee_create_valid()
+        if not success:
+            self.log_test("Audit Trail (Setup)", False, "Failed to create employee for audit test")
+            return False
+        self.make_request(
+            'PATCH', f"employees/{employee_data.get('id')}/", {"full_name": "Audited Test"},
+            extra_headers={'If-Match': employee_data.get('updated_at')}
+        )
+        updates = self.wait_for_audit({'entity': 'employee', 'object_id': employee_data.get('id'), 'action': 'updated'})
+
+        success, ids, day = self.test_bulk_mark_counts_inserted_rows()
+        _, records, _ = self.make_request('GET', 'attendance/', params={
+            'employee_ids': ','.join(str(pk) for pk in ids), 'from': day, 'to': day
+        })
+        record_ids = [row['id'] for entry in records.get('employees', []) for row in entry['attendance']]
+        bulk = [self.wait_for_audit({'entity': 'attendance', 'object_id': pk, 'action': 'created'}) for pk in record_ids]
+
+        if updates and updates[0]['changes'] == {'full_name': 'Audited Test'} and len(record_ids) == 2 and all(bulk):
+            self.log_test("Audit Trail", True, "PATCH and bulk-marked rows audited under their ids")
+            return True
+        else:
+            self.log_test("Audit Trail", False, f"Update entries: {updates}, bulk rows: {record_ids}, entries: {bulk}")
+            return False
+
+    def test_sync_tokens(self):
+        """Test GET /api/sync/ pages to a token and the next delta returns new changes"""
+        success, data, status = self.make_request('GET', 'sync/')
+        pages = 1
+        while success and data.get('next'):
+            success, data, status = self.make_request('GET', 'sync/', params={'cursor': data['next']})
+            pages += 1
+        token = data.get('token') if success else None
+        if not token:
+            self.log_test("Sync Tokens", False, f"No token after {pages} page(s). Status: {status}, Error: {data}")
+            return False
+
+        success, attendance_data = self.test_attendance_create_valid()
+        if not success:
+            return False
+        _, delta, _ = self.make_request('GET', 'sync/', params={'since': token})
+        ids = [row['id'] for row in delta.get('attendance', [])]
+
+        if delta.get('full') is False and attendance_data.get('id') in ids:
+            self.log_test("Sync Tokens", True, f"Full sync in {pages} page(s); delta has the new record")
+            return True
+        else:
+            self.log_test("Sync Tokens", False, f"Delta full={delta.get('full')}, ids={ids[:20]}")
+            return False
+
+    def test_overnight_shift_hours(self):
+        """Test a shift past midnight counts as one worked day on the check-in date"""
+        success, employee_data = self.test_employee_create_valid()
+        if not success:
+            self.log_test("Overnight Shift (Setup)", False, "Failed to create employee for compaction test")
+            return False
+
+        employee = employee_data.get('id')
+        day = date.today() - timedelta(days=500)
+        next_day = day + timedelta(days=1)
+        self.make_request('POST', 'attendance/events/', [
+            {"employee": employee, "kind": "in", "occurred_at": f"{day}T22:00:00Z"},
+            {"employee": employee, "kind": "out", "occurred_at": f"{next_day}T06:00:00Z"},
+        ])
+        self.make_request('POST', 'attendance/events/compact/')
+        _, hours, status = self.make_request('GET', 'attendance/hours/', params={'start': day, 'end': next_day})
+        row = next((row for row in hours.get('results', []) if row.get('employee') == employee), {})
+        _, records, _ = self.make_request('GET', f'attendance/{employee}/')
+        dates = sorted(record.get('date') for record in records.get('attendance', []))
+
+        if row.get('worked_minutes') == 480 and row.get('days_worked') == 1 and dates == [str(day)]:
+            self.log_test("Overnight Shift", True, "480 minutes on one day, no row for the check-out day")
+            return True
+        else:
+            self.log_test("Overnight Shift", False, f"Status: {status}, hours: {row}, attendance dates: {dates}")
+            return False
+
+    def test_write_throttle(self, burst: int = 20, rate: float = 5):
+        """Test writes beyond the token bucket burst get 429 with Retry-After"""
+        # One keep-alive connection stays on one worker, whose bucket this drains.
+        session = requests.Session()
+        url = f"{self.base_url}/api/employees/"
+        throttled = None
+        for _ in range(burst * 3):
+            response = session.post(url, json={}, timeout=30)
+            if response.status_code == 429:
+                throttled = response
+                break
+        session.close()
+        # Let the bucket refill before any later writes.
+        time.sleep(burst / rate)
+
+        if throttled is not None and throttled.headers.get('Retry-After'):
+            self.log_test("Write Throttle", True, f"429 with Retry-After: {throttled.headers['Retry-After']}")
+            return True
+        else:
+            self.log_test("Write Throttle", False, f"No 429 within {burst * 3} writes")
+            return False
+
     def cleanup_created_employees(self):
         """Clean up employees created during testing"""
         print("\n🧹 Cleaning up test data...")
@@ -382,10 +649,30 @@ class HRMSAPITester:
         self.test_dashboard_stats()
         self.test_dashboard_stats_with_date_filter()
         
+        # Compaction Tests
+        print("\n⏱️ COMPACTION TESTS")
+        print("-" * 40)
+        self.test_overnight_shift_hours()
+        
+        # Concurrency Tests
+        print("\n🔒 CONCURRENCY TESTS")
+        print("-" * 40)
+        self.test_employee_patch_if_match()
+        self.test_attendance_patch_if_match()
+        self.test_rejected_patch_creates_no_department()
+        self.test_department_move_headcount()
+        self.test_audit_trail()
+        self.test_sync_tokens()
+        # Last: it drains this client's write bucket.
+        self.test_write_throttle()
+        
         # Cleanup
         self.cleanup_created_employees()
         
-        # Results Summary
+        return self.print_summary()
+
+    def print_summary(self):
+        """Print the results summary and return the exit code"""
         print("\n" + "=" * 60)
         print("📊 TEST RESULTS SUMMARY")
         print("=" * 60)
@@ -405,10 +692,476 @@ class HRMSAPITester:
                     print(f"  ❌ {result['test']}: {result['details']}")
             return 1
 
+class HRMSInProcessTester(HRMSAPITester):
+    """
+    Checks that call into the Django app directly rather than a running
+    server: timing-sensitive paths that need a single worker, and code with
+    no endpoint of its own. Runs against a throwaway SQLite database.
+    """
+
+    def __init__(self):
+        super().__init__(base_url="in-process")
+        self.db_dir = tempfile.TemporaryDirectory()
+
+    def setup_django(self):
+        sys.path.insert(0, str(BACKEND_DIR / "benchmarks"))
+        from seed import setup_django
+        setup_django(Path(self.db_dir.name) / "test.sqlite3")
+
+    def department(self, name: str = "Engineering"):
+        from departments.models import Department
+        return Department.objects.get_or_create_by_name(name)
+
+    def test_single_flight(self, requests_sent: int = 8, delay: float = 0.3):
+        """Test concurrent identical GETs to a slow view are computed once"""
+        from django.core.cache import cache
+        from django.db import connections
+        from rest_framework.test import APIRequestFactory
+        from analytics import views
+        from hrms.metrics import counters_snapshot
+
+        compute = views.compute
+
+        def slow_compute(*args, **kwargs):
+            time.sleep(delay)
+            return compute(*args, **kwargs)
+
+        def fetch(_):
+            try:
+                return views.absenteeism(APIRequestFactory().get('/api/analytics/', {'window': 7}))
+            finally:
+                connections.close_all()
+
+        cache.clear()
+        before = counters_snapshot()
+        views.compute = slow_compute
+        try:
+            with ThreadPoolExecutor(max_workers=requests_sent) as pool:
+                responses = list(pool.map(fetch, range(requests_sent)))
+        finally:
+            views.compute = compute
+        after = counters_snapshot()
+
+        computed = after['computed'] - before['computed']
+        coalesced = after['coalesced'] - before['coalesced']
+        bodies = {json.dumps(response.data, sort_keys=True, default=str) for response in responses}
+        if all(response.status_code == 200 for response in responses) and len(bodies) == 1 \
+                and coalesced > 0 and computed + coalesced == requests_sent:
+            self.log_test("Single Flight", True, f"{requests_sent} requests: {computed} computed, {coalesced} coalesced")
+            return True
+        else:
+            self.log_test("Single Flight", False,
+                          f"Computed: {computed}, coalesced: {coalesced}, distinct bodies: {len(bodies)}, "
+                          f"statuses: {[response.status_code for response in responses]}")
+            return False
+
+    def test_profile_artifact_download(self):
+        """Test the X-Profile-Artifact URL from a staff ?profile=1 request downloads as given"""
+        from django.contrib.auth.models import User
+        from django.test import Client, override_settings
+
+        staff = User.objects.create_user("profiler", "profiler@company.com", "password", is_staff=True)
+        client = Client()
+        client.force_login(staff)
+        with override_settings(PROFILING_DIR=Path(self.db_dir.name) / "profiles"):
+            response = client.get('/api/employees/', {'profile': 1})
+            url = response.headers.get('X-Profile-Artifact')
+            download_status = client.get(url).status_code if url else None
+            anonymous_status = Client().get(url).status_code if url else None
+
+        if download_status == 200 and anonymous_status == 404:
+            self.log_test("Profile Artifact Download", True, "200 for the staff user, 404 anonymously")
+            return True
+        else:
+            self.log_test("Profile Artifact Download", False,
+                          f"Artifact: {url}, staff: {download_status}, anonymous: {anonymous_status}")
+            return False
+
+    def test_admin_changelist(self, per_page: int = 2, count_limit: int = 5):
+        """Test the admin date hierarchy links, capped N+ counts with paging past the cap, and email search"""
+        import re
+        from django.contrib.auth.models import User
+        from django.test import Client
+        from attendance.admin import AttendanceAdmin
+        from attendance.models import Attendance
+        from employees.models import Employee
+        from hrms.admin_tools import EstimatedCountPaginator
+
+        employee = Employee.objects.create(
+            employee_id="EMPADMIN", full_name="Admin Test", email="admin.test@company.com",
+            department=self.department()
+        )
+        Attendance.objects.bulk_create(
+            [Attendance(employee=employee, date=date(2019, 3, day), status='Present') for day in range(1, 13)]
+            + [Attendance(employee=employee, date=date(2018, 11, 5), status='Absent')]
+        )
+        client = Client()
+        client.force_login(User.objects.create_superuser("admin", "admin@company.com", "password"))
+
+        def changelist(**params):
+            html = client.get('/admin/attendance/attendance/', {'q': "EMPADMIN", **params}).content.decode()
+            links = lambda name: sorted({int(value) for value in re.findall(rf'[?&;]{name}=(\d+)', html)})
+            counts = re.findall(r'(\d+\+?) attendances', html)
+            pages = links('p')
+            return links, counts, pages
+
+        original = AttendanceAdmin.list_per_page, EstimatedCountPaginator.count_limit
+        AttendanceAdmin.list_per_page, EstimatedCountPaginator.count_limit = per_page, count_limit
+        try:
+            years, _, _ = changelist()
+            months_2019, _, _ = changelist(date__year=2019)
+            _, first_counts, first_pages = changelist()
+            _, later_counts, later_pages = changelist(p=3)
+        finally:
+            AttendanceAdmin.list_per_page, EstimatedCountPaginator.count_limit = original
+        hierarchy_ok = years('date__year') == [2018, 2019] and months_2019('date__month') == [3]
+        self.log_test("Admin Date Hierarchy", hierarchy_ok,
+                      f"Years: {years('date__year')}, 2019 months: {months_2019('date__month')}")
+
+        # 13 rows, 2 per page: capped at 5 on page 1 and at 8 (one page past) on page 3.
+        paging_ok = first_counts[:1] == ['5+'] and max(first_pages) == 3 \
+            and later_counts[:1] == ['8+'] and max(later_pages) == 4
+        self.log_test("Admin Capped Paging", paging_ok,
+                      f"Page 1: {first_counts[:1]} linking to {first_pages}; page 3: {later_counts[:1]} linking to {later_pages}")
+
+        html = client.get('/admin/employees/employee/', {'q': "Admin.Test@Company.com"}).content.decode()
+        search_ok = "EMPADMIN" in html
+        self.log_test("Admin Email Search", search_ok, "Mixed-case email finds the employee" if search_ok else "Not found")
+        return hierarchy_ok and paging_ok and search_ok
+
+    def seed_analytics(self, end: date, days: int, per_department: int = 4):
+        """
+        Five departments with daily attendance for `days` days ending at `end`.
+        The first department is absent in full for the last four days.
+        Returns {department name: {day: (absent, present)}}.
+        """
+        from attendance.models import Attendance
+        from employees.models import Employee
+
+        counts = {}
+        records = []
+        for index in range(5):
+            name = "Analytics Outlier" if index == 0 else f"Analytics Dept {index}"
+            department = self.department(name)
+            employees = Employee.objects.bulk_create([
+                Employee(employee_id=f"ANL{index}{number}", full_name=f"Analytics {index} {number}",
+                         email=f"analytics.{index}.{number}@company.com", department=department)
+                for number in range(per_department)
+            ])
+            counts[name] = {}
+            for offset in range(days):
+                day = end - timedelta(days=days - 1 - offset)
+                if index == 0:
+                    absent = per_department if offset >= days - 4 else offset % 2
+                else:
+                    absent = (index + offset) % 3
+                counts[name][day] = (absent, per_department - absent)
+                records.extend(
+                    Attendance(employee=employee, date=day, status='Absent' if number < absent else 'Present')
+                    for number, employee in enumerate(employees)
+                )
+        Attendance.objects.bulk_create(records)
+        return counts
+
+    @staticmethod
+    def expected_rolling(counts: Dict, end: date, window: int, history_days: int) -> List[Dict]:
+        """The rolling absence rate worked out day by day, for comparison with the engine"""
+        series = []
+        for offset in range(history_days):
+            day = end - timedelta(days=history_days - 1 - offset)
+            span = [day - timedelta(days=back) for back in range(window)]
+            absent = sum(counts.get(d, (0, 0))[0] for d in span)
+            marked = absent + sum(counts.get(d, (0, 0))[1] for d in span)
+            series.append({'date': day.isoformat(), 'absence_rate': round(absent / marked * 100, 2) if marked else None})
+        return series
+
+    def test_analytics(self, window: int = 7, history_days: int = 7):
+        """Test the rolling window and dates, the outlier flag, and the department scope"""
+        from django.core.cache import cache
+        from django.utils import timezone
+        from rest_framework.test import APIRequestFactory
+        from analytics import views
+        from analytics.engine import compute
+
+        end = timezone.localdate()
+        counts = self.seed_analytics(end, history_days + window - 1)
+        results = compute(window, end, history_days)
+        company = {}
+        for by_day in counts.values():
+            for day, (absent, present) in by_day.items():
+                total = company.get(day, (0, 0))
+                company[day] = (total[0] + absent, total[1] + present)
+
+        rolling_ok = results['all']['rolling'] == self.expected_rolling(company, end, window, history_days) and all(
+            results[key]['rolling'] == self.expected_rolling(counts[results[key]['scope']], end, window, history_days)
+            for key in results if results[key]['scope'] in counts
+        )
+        self.log_test("Analytics Rolling Window", rolling_ok,
+                      f"{window}-day rates for {results['all']['start']}..{results['all']['end']} "
+                      + ("match a day-by-day recount" if rolling_ok else f"differ: {results['all']['rolling']}"))
+
+        summary = {row['department']: row for row in results['all']['departments']}
+        flagged = [row['department'] for row in results['all']['departments'] if row['outlier']]
+        outlier_ok = flagged == ["Analytics Outlier"] and {'department': "Analytics Outlier", 'date': end.isoformat()} \
+            .items() <= next((a for a in results['all']['anomalies'] if a['date'] == end.isoformat()), {}).items()
+        self.log_test("Analytics Outlier", outlier_ok,
+                      f"Flagged: {flagged}, z-score {summary['Analytics Outlier']['z_score']}")
+
+        cache.clear()
+        response = views.absenteeism(APIRequestFactory().get('/api/analytics/', {
+            'department': "analytics dept 2", 'window': window
+        }))
+        scoped = response.data if response.status_code == 200 else {}
+        expected = self.expected_rolling(counts["Analytics Dept 2"], end, window, history_days)
+        scope_ok = scoped.get('scope') == "Analytics Dept 2" and scoped.get('rolling', [])[-history_days:] == expected \
+            and expected != self.expected_rolling(company, end, window, history_days) \
+            and all('department' not in anomaly for anomaly in scoped.get('anomalies', []))
+        self.log_test("Analytics Department Scope", scope_ok,
+                      f"Status {response.status_code}, scope {scoped.get('scope')}")
+        return rolling_ok and outlier_ok and scope_ok
+
+    def test_fold_events(self):
+        """Test check-in/check-out pairing, including shifts past midnight"""
+        from datetime import timezone
+        from attendance.compaction import fold_events
+
+        day = date(2024, 3, 4)
+
+        def at(offset_days, hour, minute=0):
+            return datetime.combine(day + timedelta(days=offset_days), datetime.min.time(), timezone.utc) \
+                + timedelta(hours=hour, minutes=minute)
+
+        def minutes(events, on=day):
+            folded = fold_events(1, on, events)
+            return folded and (folded.status, folded.worked_minutes)
+
+        cases = {
+            "day shift": (minutes([('in', at(0, 9)), ('out', at(0, 17))]), ('Present', 480)),
+            "split shift": (minutes([('in', at(0, 9)), ('out', at(0, 12)), ('in', at(0, 13)), ('out', at(0, 17, 30))]),
+                            ('Present', 450)),
+            "repeated check-in": (minutes([('in', at(0, 9)), ('in', at(0, 10)), ('out', at(0, 17))]), ('Present', 480)),
+            "overnight, check-in day": (minutes([('in', at(0, 22)), ('out', at(1, 6)), ('in', at(1, 22))]),
+                                        ('Present', 480)),
+            "overnight, check-out day": (minutes([('out', at(1, 6))], on=day + timedelta(days=1)), None),
+            "check-out only": (minutes([('out', at(0, 17))]), None),
+            "unmatched check-in": (minutes([('in', at(0, 9))]), ('Present', 0)),
+            "next day's shift ignored": (minutes([('in', at(0, 9)), ('out', at(0, 17)), ('in', at(1, 9)), ('out', at(1, 17))]),
+                                         ('Present', 480)),
+        }
+        failed = {name: got for name, (got, expected) in cases.items() if got != expected}
+        folded = fold_events(1, day, [('in', at(0, 22)), ('out', at(1, 6))])
+        if folded.last_check_out != at(1, 6):
+            failed["overnight last_check_out"] = folded.last_check_out
+
+        if not failed:
+            self.log_test("Fold Events", True, f"{len(cases)} cases")
+            return True
+        else:
+            self.log_test("Fold Events", False, f"Unexpected results: {failed}")
+            return False
+
+    def test_compaction_keeps_manual_status(self):
+        """Test compaction fills in times but keeps a status marked by hand"""
+        from attendance.compaction import compact_events
+        from attendance.models import Attendance, AttendanceEvent
+        from employees.models import Employee
+
+        employee = Employee.objects.create(
+            employee_id="EMPFOLD", full_name="Fold Test", email="fold.test@company.com",
+            department_id=self.department().id
+        )
+        day = date(2024, 3, 4)
+        Attendance.objects.create(employee=employee, date=day, status='Absent')
+        AttendanceEvent.objects.bulk_create([
+            AttendanceEvent(employee=employee, kind='in', occurred_at=f"{day}T09:00:00Z"),
+            AttendanceEvent(employee=employee, kind='out', occurred_at=f"{day}T17:00:00Z"),
+            AttendanceEvent(employee=employee, kind='out', occurred_at=f"{day + timedelta(days=2)}T17:00:00Z"),
+        ])
+        compact_events()
+        rows = {row.date: (row.status, row.worked_minutes) for row in Attendance.objects.filter(employee=employee)}
+
+        if rows == {day: ('Absent', 480)}:
+            self.log_test("Compaction (Manual Status)", True, "Status kept, minutes filled in, no row for a stray check-out")
+            return True
+        else:
+            self.log_test("Compaction (Manual Status)", False, f"Rows: {rows}")
+            return False
+
+    def run_all_tests(self):
+        """Run the in-process checks"""
+        print("🚀 Starting HRMS Lite In-Process Tests")
+        print("=" * 60)
+        self.setup_django()
+
+        print("\n🔒 CONCURRENCY TESTS")
+        print("-" * 40)
+        self.test_single_flight()
+
+        print("\n🔬 PROFILING TESTS")
+        print("-" * 40)
+        self.test_profile_artifact_download()
+
+        print("\n🛠️ ADMIN TESTS")
+        print("-" * 40)
+        self.test_admin_changelist()
+
+        print("\n📈 ANALYTICS TESTS")
+        print("-" * 40)
+        self.test_analytics()
+
+        print("\n⏱️ COMPACTION TESTS")
+        print("-" * 40)
+        self.test_fold_events()
+        self.test_compaction_keeps_manual_status()
+
+        self.db_dir.cleanup()
+        return self.print_summary()
+
+class HRMSStatusCheckTester(HRMSAPITester):
+    """
+    Checks for the FastAPI status-check service in backend/server.py, run
+    in-process against mongomock-motor instead of a MongoDB server.
+    """
+
+    def __init__(self):
+        super().__init__(base_url="in-process")
+        self.client = None
+
+    def setup_app(self):
+        sys.path.insert(0, str(BACKEND_DIR))
+        os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+        os.environ.setdefault('DB_NAME', 'hrms_test')
+        from fastapi.testclient import TestClient
+        from mongomock_motor import AsyncMongoMockClient
+        import server
+
+        logging.getLogger('httpx').setLevel(logging.WARNING)
+        database = AsyncMongoMockClient(tz_aware=True)['hrms_test']
+        server.app.dependency_overrides[server.get_db] = lambda: database
+        self.database = database
+        self.client = TestClient(server.app)
+
+    def make_request(self, method: str, endpoint: str, data: Any = None, params: Dict = None,
+                     extra_headers: Dict = None) -> Tuple[bool, Any, int]:
+        """Call the app in-process and return success, response data, status code"""
+        response = self.client.request(method, f"/api/{endpoint}", json=data, params=params, headers=extra_headers)
+        try:
+            response_data = response.json()
+        except ValueError:
+            response_data = {"raw_response": response.text}
+        return response.status_code < 400, response_data, response.status_code
+
+    def test_startup_with_legacy_document(self):
+        """Test the app starts while a document still has a string timestamp"""
+        import asyncio
+        asyncio.run(self.database.status_checks.insert_one(
+            {"id": "legacy", "client_name": "Legacy", "timestamp": "2024-01-01T00:00:00+00:00"}
+        ))
+        try:
+            self.client.__enter__()
+        except Exception as e:
+            self.log_test("Status Startup (Legacy Document)", False, f"Startup failed: {e!r}")
+            return False
+        asyncio.run(self.database.status_checks.delete_one({"id": "legacy"}))
+        self.log_test("Status Startup (Legacy Document)", True, "Started; the conversion is left to convert_status_timestamps.py")
+        return True
+
+    def test_status_bulk(self):
+        """Test POST /api/status/bulk inserts every check and enforces the limit"""
+        success, data, status = self.make_request('POST', 'status/bulk', [{"client_name": f"Bulk {i}"} for i in range(5)])
+        _, empty, _ = self.make_request('POST', 'status/bulk', [])
+        _, _, too_many_status = self.make_request('POST', 'status/bulk', [{"client_name": "Bulk"}] * 1001)
+        _, listed, _ = self.make_request('GET', 'status', params={'limit': 1000})
+        listed_ids = {row['id'] for row in listed}
+
+        if success and len(data) == 5 and all(row['id'] in listed_ids for row in data) and empty == [] \
+                and too_many_status == 413:
+            self.log_test("Status Bulk", True, "5 inserted and listed, [] for an empty body, 413 past the limit")
+            return True
+        else:
+            self.log_test("Status Bulk", False, f"Status: {status}, inserted: {len(data)}, over limit: {too_many_status}")
+            return False
+
+    def test_status_echoed_until(self):
+        """Test a POSTed check's own timestamp and id, passed back as until/until_id, exclude it"""
+        _, created, _ = self.make_request('POST', 'status', {"client_name": "Echo"})
+        _, page, status = self.make_request('GET', 'status', params={
+            'until': created['timestamp'], 'until_id': created['id'], 'limit': 1000
+        })
+        _, same, _ = self.make_request('GET', 'status', params={'since': created['timestamp'], 'limit': 1000})
+
+        # MongoDB keeps milliseconds (mongomock keeps more), so a finer timestamp would not match.
+        whole_ms = datetime.fromisoformat(created['timestamp'].replace('Z', '+00:00')).microsecond % 1000 == 0
+        if status == 200 and whole_ms and created['id'] not in {row['id'] for row in page} \
+                and created['id'] in {row['id'] for row in same}:
+            self.log_test("Status Until (Echoed)", True, f"Timestamp {created['timestamp']} matches the stored one")
+            return True
+        else:
+            self.log_test("Status Until (Echoed)", False, f"Timestamp {created['timestamp']}; status {status}")
+            return False
+
+    def test_status_paging(self, page_size: int = 3):
+        """Test until/until_id pages through every check once, newest first, and since filters"""
+        import asyncio
+        from datetime import timezone
+        # Pairs share a timestamp, so pages break inside ties and until_id decides.
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        asyncio.run(self.database.status_checks.insert_many([
+            {"id": f"paging-{i}", "client_name": "Paging", "timestamp": base + timedelta(seconds=i // 2)}
+            for i in range(8)
+        ]))
+        _, expected, _ = self.make_request('GET', 'status', params={'limit': 1000})
+        seen, params = [], {'limit': page_size}
+        while True:
+            _, page, status = self.make_request('GET', 'status', params=params)
+            if status != 200 or not page:
+                break
+            seen.extend(page)
+            params = {'limit': page_size, 'until': page[-1]['timestamp'], 'until_id': page[-1]['id']}
+        newest_first = all(
+            (a['timestamp'], a['id']) >= (b['timestamp'], b['id']) for a, b in zip(seen, seen[1:])
+        )
+
+        middle = next(row for row in expected if row['id'] == 'paging-4')
+        _, recent, _ = self.make_request('GET', 'status', params={'since': middle['timestamp'], 'limit': 1000})
+        wanted = [row['id'] for row in expected if row['timestamp'] >= middle['timestamp']]
+
+        if [row['id'] for row in seen] == [row['id'] for row in expected] and newest_first \
+                and [row['id'] for row in recent] == wanted:
+            self.log_test("Status Paging", True,
+                          f"{len(seen)} checks in pages of {page_size}; since returns {len(recent)}")
+            return True
+        else:
+            self.log_test("Status Paging", False,
+                          f"Paged {len(seen)} of {len(expected)}, newest first: {newest_first}, "
+                          f"since returned {len(recent)} of {len(wanted)}")
+            return False
+
+    def run_all_tests(self):
+        """Run the status-check service checks"""
+        print("🚀 Starting Status Check Service Tests")
+        print("=" * 60)
+        try:
+            self.setup_app()
+        except ImportError as e:
+            print(f"⚠️  Skipped: {e}")
+            return 0
+
+        print("\n📡 STATUS CHECK TESTS")
+        print("-" * 40)
+        if self.test_startup_with_legacy_document():
+            self.test_status_bulk()
+            self.test_status_echoed_until()
+            self.test_status_paging()
+            self.client.__exit__(None, None, None)
+        return self.print_summary()
+
 def main():
     """Main test execution"""
     tester = HRMSAPITester()
-    return tester.run_all_tests()
+    api_result = tester.run_all_tests()
+    in_process_result = HRMSInProcessTester().run_all_tests()
+    return HRMSStatusCheckTester().run_all_tests() or in_process_result or api_result
 
 if __name__ == "__main__":
     sys.exit(main())
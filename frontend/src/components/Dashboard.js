@@ -17,6 +17,41 @@ const Dashboard = () => {
     fetchStats();
   }, [selectedDate]);
 
+  useEffect(() => {
+    const source = new EventSource(`${API_BASE_URL}/api/events/`);
+    const applyCounters = (event) => {
+      const { delta, counters } = JSON.parse(event.data);
+      setStats((prev) => {
+        const next = {
+          ...prev,
+          total_employees: prev.total_employees + (delta.total_employees || 0),
+          total_attendance_records: prev.total_attendance_records + (delta.total_attendance_records || 0)
+        };
+        if (counters.date === selectedDate) {
+          next.today_present = counters.present;
+          next.today_absent = counters.absent;
+        }
+        return next;
+      });
+    };
+    ['employee.created', 'attendance.marked', 'attendance.batch', 'attendance.deleted'].forEach((kind) =>
+      source.addEventListener(kind, applyCounters)
+    );
+    // Deleting an employee cascades to every date, so re-read the daily counts.
+    source.addEventListener('employee.deleted', () => fetchStats());
+    // The server refuses streams beyond its cap; poll instead.
+    let poll;
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED && !poll) {
+        poll = setInterval(fetchStats, 30000);
+      }
+    };
+    return () => {
+      source.close();
+      clearInterval(poll);
+    };
+  }, [selectedDate]);
+
   const fetchStats = async () => {
     try {
       setLoading(true);